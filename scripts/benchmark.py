@@ -10,6 +10,9 @@ import argparse
 import json
 import time
 from pathlib import Path
+from statistics import mean, median
+
+from xsdmesh.parser import parse_schema
 
 
 def benchmark_parse(schema_file: Path, iterations: int = 10) -> dict[str, float]:
@@ -26,39 +29,51 @@ def benchmark_parse(schema_file: Path, iterations: int = 10) -> dict[str, float]
     print(f"Iterations: {iterations}")
     print("-" * 50)
 
-    times: list[float] = []
+    # Warmup run: excluded from statistics (cold caches, lazy imports)
+    parse_schema(schema_file)
+
+    times_ns = [0] * iterations
 
     for i in range(iterations):
-        start = time.perf_counter()
-        # TODO: Implement actual parsing when Schema class is ready
-        # schema = Schema.from_file(schema_file)
-        end = time.perf_counter()
-        elapsed = end - start
-        times.append(elapsed)
-        print(f"Iteration {i + 1}: {elapsed * 1000:.2f}ms")
-
-    avg = sum(times) / len(times)
-    min_time = min(times)
-    max_time = max(times)
-    median = sorted(times)[len(times) // 2]
+        start = time.perf_counter_ns()
+        parse_schema(schema_file)
+        times_ns[i] = elapsed = time.perf_counter_ns() - start
+        print(f"Iteration {i + 1}: {elapsed / 1e6:.2f}ms")
+
+    # Convert to ms once, at report time
+    avg = mean(times_ns) / 1e6
+    min_time = min(times_ns) / 1e6
+    max_time = max(times_ns) / 1e6
+    med = median(times_ns) / 1e6
 
     print("-" * 50)
-    print(f"Average: {avg * 1000:.2f}ms")
-    print(f"Min: {min_time * 1000:.2f}ms")
-    print(f"Max: {max_time * 1000:.2f}ms")
-    print(f"Median: {median * 1000:.2f}ms")
+    print(f"Average: {avg:.2f}ms")
+    print(f"Min: {min_time:.2f}ms")
+    print(f"Max: {max_time:.2f}ms")
+    print(f"Median: {med:.2f}ms")
 
     return {
-        "avg": avg * 1000,  # Convert to ms
-        "min": min_time * 1000,
-        "max": max_time * 1000,
-        "median": median * 1000,
+        "avg": avg,
+        "min": min_time,
+        "max": max_time,
+        "median": med,
     }
 
 
 def main() -> None:
     """Main entry point."""
     parser = argparse.ArgumentParser(description="XSDMesh Performance Benchmark")
+    parser.add_argument(
+        "--schema",
+        type=Path,
+        help="XSD schema file to benchmark parsing on",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=10,
+        help="Number of iterations (default: 10)",
+    )
     parser.add_argument(
         "--output",
         type=Path,
@@ -70,27 +85,32 @@ def main() -> None:
     print("=" * 50)
     print()
 
-    # Generate minimal benchmark results for CI
-    # TODO: Replace with real benchmarks when parser is complete
-    results = [
-        {
-            "name": "SAX parser foundation (placeholder)",
-            "unit": "ms",
-            "value": 0.0,
-        }
-    ]
+    if args.schema:
+        stats = benchmark_parse(args.schema, args.iterations)
+        results = [
+            {
+                "name": f"parse_schema {args.schema.name} (median)",
+                "unit": "ms",
+                "value": stats["median"],
+            }
+        ]
+    else:
+        # Generate minimal benchmark results for CI
+        results = [
+            {
+                "name": "SAX parser foundation (placeholder)",
+                "unit": "ms",
+                "value": 0.0,
+            }
+        ]
 
     if args.output:
         args.output.parent.mkdir(parents=True, exist_ok=True)
         with args.output.open("w") as f:
             json.dump(results, f, indent=2)
         print(f"Benchmark results written to {args.output}")
-    else:
-        print("Note: Benchmarking not yet implemented")
-        print("Will be available when Schema parser is complete")
-        print()
-        # Example usage (uncomment when ready):
-        # benchmark_parse(Path("tests/fixtures/complex/schema.xsd"))
+    elif not args.schema:
+        print("Note: pass --schema to benchmark parsing of a schema file")
 
 
 if __name__ == "__main__":
@@ -6,6 +6,8 @@ and enumeration values per XSD 1.0 specification.
 
 from __future__ import annotations
 
+import sys
+from enum import IntFlag
 from typing import Literal
 
 # ============================================================================
@@ -97,7 +99,59 @@ DERIVED_TYPES = frozenset(
 SPECIAL_TYPES = frozenset(["anyType", "anySimpleType", "anyAtomicType"])
 """Special types: anyType (complex base), anySimpleType (simple base), anyAtomicType (XSD 1.1)."""
 
-ALL_BUILTIN_TYPES = PRIMITIVE_TYPES | DERIVED_TYPES | SPECIAL_TYPES
+# Spelled out (not PRIMITIVE_TYPES | DERIVED_TYPES | SPECIAL_TYPES) so the
+# constant is built directly at import; tests guard it against the union.
+ALL_BUILTIN_TYPES = frozenset(
+    [
+        "ENTITIES",
+        "ENTITY",
+        "ID",
+        "IDREF",
+        "IDREFS",
+        "NCName",
+        "NMTOKEN",
+        "NMTOKENS",
+        "NOTATION",
+        "Name",
+        "QName",
+        "anyAtomicType",
+        "anySimpleType",
+        "anyType",
+        "anyURI",
+        "base64Binary",
+        "boolean",
+        "byte",
+        "date",
+        "dateTime",
+        "decimal",
+        "double",
+        "duration",
+        "float",
+        "gDay",
+        "gMonth",
+        "gMonthDay",
+        "gYear",
+        "gYearMonth",
+        "hexBinary",
+        "int",
+        "integer",
+        "language",
+        "long",
+        "negativeInteger",
+        "nonNegativeInteger",
+        "nonPositiveInteger",
+        "normalizedString",
+        "positiveInteger",
+        "short",
+        "string",
+        "time",
+        "token",
+        "unsignedByte",
+        "unsignedInt",
+        "unsignedLong",
+        "unsignedShort",
+    ]
+)
 """All built-in types (primitive + derived + special)."""
 
 # ============================================================================
@@ -106,7 +160,25 @@ ALL_BUILTIN_TYPES = PRIMITIVE_TYPES | DERIVED_TYPES | SPECIAL_TYPES
 
 TYPE_DERIVATION: dict[str, str | None] = {
     # Primitives derive from anySimpleType
-    **dict.fromkeys(PRIMITIVE_TYPES, "anySimpleType"),
+    "string": "anySimpleType",
+    "boolean": "anySimpleType",
+    "decimal": "anySimpleType",
+    "float": "anySimpleType",
+    "double": "anySimpleType",
+    "duration": "anySimpleType",
+    "dateTime": "anySimpleType",
+    "time": "anySimpleType",
+    "date": "anySimpleType",
+    "gYearMonth": "anySimpleType",
+    "gYear": "anySimpleType",
+    "gMonthDay": "anySimpleType",
+    "gDay": "anySimpleType",
+    "gMonth": "anySimpleType",
+    "hexBinary": "anySimpleType",
+    "base64Binary": "anySimpleType",
+    "anyURI": "anySimpleType",
+    "QName": "anySimpleType",
+    "NOTATION": "anySimpleType",
     # String derivatives
     "normalizedString": "string",
     "token": "normalizedString",
@@ -148,6 +220,92 @@ TYPE_DERIVATION: dict[str, str | None] = {
 LIST_TYPES = frozenset(["NMTOKENS", "IDREFS", "ENTITIES"])
 """Built-in list types (space-separated values)."""
 
+# ============================================================================
+# Built-in Type IDs and Category Bitmasks
+# ============================================================================
+
+BUILTIN_TYPE_IDS: dict[str, int] = {
+    sys.intern(name): type_id for type_id, name in enumerate(sorted(ALL_BUILTIN_TYPES))
+}
+"""Small integer ID for each built-in type (stable: sorted by name)."""
+
+
+def _type_mask(names: frozenset[str]) -> int:
+    """Build bitmask with one bit set per type ID in names."""
+    mask = 0
+    for name in names:
+        mask |= 1 << BUILTIN_TYPE_IDS[name]
+    return mask
+
+
+PRIMITIVE_TYPES_MASK = _type_mask(PRIMITIVE_TYPES)
+"""Bitmask of PRIMITIVE_TYPES over BUILTIN_TYPE_IDS."""
+
+DERIVED_TYPES_MASK = _type_mask(DERIVED_TYPES)
+"""Bitmask of DERIVED_TYPES over BUILTIN_TYPE_IDS."""
+
+SPECIAL_TYPES_MASK = _type_mask(SPECIAL_TYPES)
+"""Bitmask of SPECIAL_TYPES over BUILTIN_TYPE_IDS."""
+
+LIST_TYPES_MASK = _type_mask(LIST_TYPES)
+"""Bitmask of LIST_TYPES over BUILTIN_TYPE_IDS."""
+
+
+def _ancestor_chain(name: str) -> list[str]:
+    """Walk TYPE_DERIVATION from name to the root (excluding name)."""
+    chain: list[str] = []
+    base = TYPE_DERIVATION[name]
+    while base is not None:
+        chain.append(base)
+        base = TYPE_DERIVATION[base]
+    return chain
+
+
+_TYPES_BY_ID = sorted(BUILTIN_TYPE_IDS, key=BUILTIN_TYPE_IDS.__getitem__)
+
+TYPE_ANCESTOR_MASKS: tuple[int, ...] = tuple(
+    _type_mask(frozenset(_ancestor_chain(name))) for name in _TYPES_BY_ID
+)
+"""Bitmask of all proper ancestors for each built-in type, indexed by type ID."""
+
+TYPE_DEPTHS: tuple[int, ...] = tuple(len(_ancestor_chain(name)) for name in _TYPES_BY_ID)
+"""Derivation depth for each built-in type (anyType = 0), indexed by type ID."""
+
+
+def is_derived_from(type_id: int, base_id: int) -> bool:
+    """Check if built-in type derives (directly or transitively) from base.
+
+    Args:
+        type_id: Derived type ID from BUILTIN_TYPE_IDS
+        base_id: Candidate base type ID from BUILTIN_TYPE_IDS
+
+    Returns:
+        True if base is a proper ancestor of type
+
+    Examples:
+        >>> is_derived_from(BUILTIN_TYPE_IDS["byte"], BUILTIN_TYPE_IDS["integer"])
+        True
+    """
+    return bool(TYPE_ANCESTOR_MASKS[type_id] >> base_id & 1)
+
+
+def type_in_mask(type_id: int, mask: int) -> bool:
+    """Check if built-in type ID is a member of a category bitmask.
+
+    Args:
+        type_id: Value from BUILTIN_TYPE_IDS
+        mask: Category bitmask (e.g. PRIMITIVE_TYPES_MASK)
+
+    Returns:
+        True if the type's bit is set in mask
+
+    Examples:
+        >>> type_in_mask(BUILTIN_TYPE_IDS["string"], PRIMITIVE_TYPES_MASK)
+        True
+    """
+    return bool(mask >> type_id & 1)
+
+
 # ============================================================================
 # XSD Element Names
 # ============================================================================
@@ -210,6 +368,57 @@ ELEMENT_ANNOTATION = "annotation"
 ELEMENT_DOCUMENTATION = "documentation"
 ELEMENT_APPINFO = "appinfo"
 
+XSD_ELEMENTS: tuple[str, ...] = (
+    ELEMENT_SCHEMA,
+    ELEMENT_ELEMENT,
+    ELEMENT_ATTRIBUTE,
+    ELEMENT_SIMPLE_TYPE,
+    ELEMENT_COMPLEX_TYPE,
+    ELEMENT_GROUP,
+    ELEMENT_ATTRIBUTE_GROUP,
+    ELEMENT_IMPORT,
+    ELEMENT_INCLUDE,
+    ELEMENT_REDEFINE,
+    ELEMENT_OVERRIDE,
+    ELEMENT_RESTRICTION,
+    ELEMENT_EXTENSION,
+    ELEMENT_LIST,
+    ELEMENT_UNION,
+    ELEMENT_SIMPLE_CONTENT,
+    ELEMENT_COMPLEX_CONTENT,
+    ELEMENT_SEQUENCE,
+    ELEMENT_CHOICE,
+    ELEMENT_ALL,
+    ELEMENT_MIN_EXCLUSIVE,
+    ELEMENT_MIN_INCLUSIVE,
+    ELEMENT_MAX_EXCLUSIVE,
+    ELEMENT_MAX_INCLUSIVE,
+    ELEMENT_TOTAL_DIGITS,
+    ELEMENT_FRACTION_DIGITS,
+    ELEMENT_LENGTH,
+    ELEMENT_MIN_LENGTH,
+    ELEMENT_MAX_LENGTH,
+    ELEMENT_ENUMERATION,
+    ELEMENT_WHITE_SPACE,
+    ELEMENT_PATTERN,
+    ELEMENT_ANY,
+    ELEMENT_ANY_ATTRIBUTE,
+    ELEMENT_UNIQUE,
+    ELEMENT_KEY,
+    ELEMENT_KEYREF,
+    ELEMENT_SELECTOR,
+    ELEMENT_FIELD,
+    ELEMENT_ANNOTATION,
+    ELEMENT_DOCUMENTATION,
+    ELEMENT_APPINFO,
+)
+"""All XSD element local names, in declaration order."""
+
+XSD_CLARK_TAGS: dict[str, str] = {
+    sys.intern(f"{{{XSD_NAMESPACE}}}{name}"): name for name in XSD_ELEMENTS
+}
+"""Clark-notation tag ("{ns}local", as reported by lxml) -> XSD element local name."""
+
 # ============================================================================
 # XSD Attribute Names
 # ============================================================================
@@ -283,11 +492,93 @@ ProcessContents = Literal["strict", "lax", "skip"]
 WhiteSpaceAction = Literal["preserve", "replace", "collapse"]
 """Whitespace normalization action."""
 
-BlockSet = Literal["#all", "extension", "restriction", "substitution"]
-"""Block derivation/substitution set."""
 
-FinalSet = Literal["#all", "extension", "restriction", "list", "union"]
-"""Final derivation set."""
+class BlockSet(IntFlag):
+    """Block derivation/substitution set (block, blockDefault)."""
+
+    EXTENSION = 1
+    RESTRICTION = 2
+    SUBSTITUTION = 4
+    ALL = EXTENSION | RESTRICTION | SUBSTITUTION
+
+
+class FinalSet(IntFlag):
+    """Final derivation set (final, finalDefault)."""
+
+    EXTENSION = 1
+    RESTRICTION = 2
+    LIST = 4
+    UNION = 8
+    ALL = EXTENSION | RESTRICTION | LIST | UNION
+
+
+_BLOCK_TOKENS: dict[str, BlockSet] = {
+    "#all": BlockSet.ALL,
+    "extension": BlockSet.EXTENSION,
+    "restriction": BlockSet.RESTRICTION,
+    "substitution": BlockSet.SUBSTITUTION,
+}
+
+_FINAL_TOKENS: dict[str, FinalSet] = {
+    "#all": FinalSet.ALL,
+    "extension": FinalSet.EXTENSION,
+    "restriction": FinalSet.RESTRICTION,
+    "list": FinalSet.LIST,
+    "union": FinalSet.UNION,
+}
+
+
+def parse_block_set(value: str) -> BlockSet:
+    """Parse block/blockDefault attribute value into flags.
+
+    Args:
+        value: Space-separated tokens (e.g. "extension restriction" or "#all")
+
+    Returns:
+        Combined BlockSet flags (empty string gives BlockSet(0))
+
+    Raises:
+        ValueError: If a token is not a valid block value
+
+    Examples:
+        >>> parse_block_set("extension restriction")
+        <BlockSet.EXTENSION|RESTRICTION: 3>
+    """
+    flags = BlockSet(0)
+    for token in value.split():
+        try:
+            flags |= _BLOCK_TOKENS[token]
+        except KeyError:
+            msg = f"Invalid block value: '{token}'"
+            raise ValueError(msg) from None
+    return flags
+
+
+def parse_final_set(value: str) -> FinalSet:
+    """Parse final/finalDefault attribute value into flags.
+
+    Args:
+        value: Space-separated tokens (e.g. "list union" or "#all")
+
+    Returns:
+        Combined FinalSet flags (empty string gives FinalSet(0))
+
+    Raises:
+        ValueError: If a token is not a valid final value
+
+    Examples:
+        >>> parse_final_set("#all") == FinalSet.ALL
+        True
+    """
+    flags = FinalSet(0)
+    for token in value.split():
+        try:
+            flags |= _FINAL_TOKENS[token]
+        except KeyError:
+            msg = f"Invalid final value: '{token}'"
+            raise ValueError(msg) from None
+    return flags
+
 
 # ============================================================================
 # Default Values
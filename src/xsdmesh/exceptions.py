@@ -13,12 +13,33 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
+def _join(*parts: str | None) -> str:
+    """Join message parts with spaces, skipping empty/None parts.
+
+    Shared by all exception __str__ methods: one str.join per rendering.
+    """
+    return " ".join([part for part in parts if part])
+
+
 class XSDMeshError(Exception):
     """Base exception for all XSDMesh errors.
 
     All library exceptions inherit from this for unified error handling.
+    Every subclass declares __slots__ for its context fields.
     """
 
+    __slots__ = ()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle support including slot-stored context fields."""
+        state = {
+            name: getattr(self, name)
+            for klass in type(self).__mro__
+            for name in klass.__dict__.get("__slots__", ())
+            if hasattr(self, name)
+        }
+        return type(self), self.args, state
+
 
 class FrozenError(XSDMeshError):
     """Raised when attempting to modify a frozen component.
@@ -26,6 +47,8 @@ class FrozenError(XSDMeshError):
     Components become immutable after freeze() is called.
     """
 
+    __slots__ = ()
+
 
 class ParseError(XSDMeshError):
     """XML/XSD parsing error with location context.
@@ -33,6 +56,8 @@ class ParseError(XSDMeshError):
     Raised when XML is malformed or XSD structure is invalid.
     """
 
+    __slots__ = ("message", "file_path", "line", "column", "context", "element")
+
     def __init__(
         self,
         message: str,
@@ -53,27 +78,30 @@ class ParseError(XSDMeshError):
             context: XPath-like path to error location
             element: Current element name
         """
+        super().__init__(message)
+        self.message = message
         self.file_path = file_path
         self.line = line
         self.column = column
         self.context = context
         self.element = element
 
-        # Build detailed message
-        parts = [message]
-        if file_path:
-            parts.append(f"in {file_path}")
-        if line is not None:
-            if column is not None:
-                parts.append(f"at line {line}, column {column}")
-            else:
-                parts.append(f"at line {line}")
-        if context:
-            parts.append(f"(context: {context})")
-        if element:
-            parts.append(f"(element: {element})")
-
-        super().__init__(" ".join(parts))
+    def __str__(self) -> str:
+        """Build detailed message (lazily, only when rendered)."""
+        line = self.line
+        if line is None:
+            location = None
+        elif self.column is None:
+            location = f"at line {line}"
+        else:
+            location = f"at line {line}, column {self.column}"
+        return _join(
+            self.message,
+            f"in {self.file_path}" if self.file_path else None,
+            location,
+            f"(context: {self.context})" if self.context else None,
+            f"(element: {self.element})" if self.element else None,
+        )
 
 
 class XMLSyntaxError(ParseError):
@@ -82,6 +110,8 @@ class XMLSyntaxError(ParseError):
     XML is not well-formed according to XML 1.0 spec.
     """
 
+    __slots__ = ()
+
 
 class SchemaStructureError(ParseError):
     """Invalid XSD schema structure.
@@ -89,6 +119,8 @@ class SchemaStructureError(ParseError):
     Schema violates XSD meta-schema constraints.
     """
 
+    __slots__ = ()
+
 
 class NamespaceError(ParseError):
     """Namespace resolution error.
@@ -96,6 +128,8 @@ class NamespaceError(ParseError):
     Unresolved prefix, conflicting namespaces, or invalid URI.
     """
 
+    __slots__ = ()
+
 
 class ValidationError(XSDMeshError):
     """Schema validation error with severity levels.
@@ -103,6 +137,8 @@ class ValidationError(XSDMeshError):
     Supports W3C error codes and optional error recovery.
     """
 
+    __slots__ = ("_message", "_message_args", "severity", "code", "context", "recovery")
+
     def __init__(
         self,
         message: str,
@@ -111,30 +147,44 @@ class ValidationError(XSDMeshError):
         code: str | None = None,
         context: str | None = None,
         recovery: Callable[[], Any] | None = None,
+        message_args: tuple[object, ...] = (),
     ) -> None:
         """Initialize validation error.
 
         Args:
-            message: Error description
+            message: Error description, or a str.format template when
+                message_args is given
             severity: Error severity level
             code: W3C error code (e.g., "src-element.2.1")
             context: Schema component path
             recovery: Optional recovery function
+            message_args: Positional arguments for the message template
+                (formatted only when the message is first read)
         """
+        super().__init__(message)
+        self._message = message
+        self._message_args = message_args
         self.severity = severity
         self.code = code
         self.context = context
         self.recovery = recovery
 
-        # Build message with code
-        parts = [f"[{severity.upper()}]"]
-        if code:
-            parts.append(f"[{code}]")
-        parts.append(message)
-        if context:
-            parts.append(f"(at {context})")
+    @property
+    def message(self) -> str:
+        """Error description (template formatted on first access)."""
+        if self._message_args:
+            self._message = self._message.format(*self._message_args)
+            self._message_args = ()
+        return self._message
 
-        super().__init__(" ".join(parts))
+    def __str__(self) -> str:
+        """Build message with severity and code (lazily, only when rendered)."""
+        return _join(
+            f"[{self.severity.upper()}]",
+            f"[{self.code}]" if self.code else None,
+            self.message,
+            f"(at {self.context})" if self.context else None,
+        )
 
 
 class ResolutionError(XSDMeshError):
@@ -143,6 +193,8 @@ class ResolutionError(XSDMeshError):
     Failed to resolve QName reference to schema component.
     """
 
+    __slots__ = ("message", "qname", "reference_type", "location")
+
     def __init__(
         self,
         message: str,
@@ -160,20 +212,20 @@ class ResolutionError(XSDMeshError):
             reference_type: Type of reference
             location: Where reference was found
         """
+        super().__init__(message)
+        self.message = message
         self.qname = qname
         self.reference_type = reference_type
         self.location = location
 
-        # Build detailed message
-        parts = [message]
-        if qname:
-            parts.append(f"'{qname}'")
-        if reference_type:
-            parts.append(f"(type: {reference_type})")
-        if location:
-            parts.append(f"at {location}")
-
-        super().__init__(" ".join(parts))
+    def __str__(self) -> str:
+        """Build detailed message (lazily, only when rendered)."""
+        return _join(
+            self.message,
+            f"'{self.qname}'" if self.qname else None,
+            f"(type: {self.reference_type})" if self.reference_type else None,
+            f"at {self.location}" if self.location else None,
+        )
 
 
 class CircularReferenceError(ResolutionError):
@@ -183,6 +235,8 @@ class CircularReferenceError(ResolutionError):
     or import/include cycle.
     """
 
+    __slots__ = ("cycle",)
+
     def __init__(
         self,
         message: str,
@@ -202,12 +256,16 @@ class CircularReferenceError(ResolutionError):
             reference_type: Type of reference
             location: Where reference was found
         """
-        self.cycle = cycle or []
         super().__init__(message, qname=qname, reference_type=reference_type, location=location)
+        self.cycle = cycle or []
 
-        if self.cycle:
-            cycle_str = " -> ".join(self.cycle + [self.cycle[0]])
-            self.args = (f"{self.args[0]} (cycle: {cycle_str})",)
+    def __str__(self) -> str:
+        """Build detailed message including the cycle path."""
+        cycle = self.cycle
+        return _join(
+            super().__str__(),
+            f"(cycle: {' -> '.join([*cycle, cycle[0]])})" if cycle else None,
+        )
 
 
 class CacheError(XSDMeshError):
@@ -216,6 +274,8 @@ class CacheError(XSDMeshError):
     Failed to load, save, or invalidate cached schema.
     """
 
+    __slots__ = ()
+
 
 class SchemaImportError(XSDMeshError):
     """Schema import/include error.
@@ -224,6 +284,8 @@ class SchemaImportError(XSDMeshError):
     Named SchemaImportError to avoid shadowing Python's builtin ImportError.
     """
 
+    __slots__ = ("message", "namespace", "location", "cause")
+
     def __init__(
         self,
         message: str,
@@ -240,17 +302,17 @@ class SchemaImportError(XSDMeshError):
             location: Schema location
             cause: Original exception
         """
+        super().__init__(message)
+        self.message = message
         self.namespace = namespace
         self.location = location
         self.cause = cause
 
-        # Build message
-        parts = [message]
-        if namespace:
-            parts.append(f"(namespace: {namespace})")
-        if location:
-            parts.append(f"(location: {location})")
-        if cause:
-            parts.append(f"- caused by: {cause}")
-
-        super().__init__(" ".join(parts))
+    def __str__(self) -> str:
+        """Build detailed message (lazily, only when rendered)."""
+        return _join(
+            self.message,
+            f"(namespace: {self.namespace})" if self.namespace else None,
+            f"(location: {self.location})" if self.location else None,
+            f"- caused by: {self.cause}" if self.cause else None,
+        )
@@ -7,7 +7,7 @@ from xsdmesh.parser.context import ParseContext
 from xsdmesh.parser.events import Event, EventBuffer, EventType
 from xsdmesh.parser.handlers import ComponentHandler
 from xsdmesh.parser.xml_parser import ParseResult, SAXParser, parse_schema
-from xsdmesh.types.qname import QName, is_ncname, parse_qname, split_qname
+from xsdmesh.types.qname import QName, is_ncname, is_ncname_all, parse_qname, split_qname
 
 __all__ = [
     # Core parser
@@ -27,4 +27,5 @@ __all__ = [
     "parse_qname",
     "split_qname",
     "is_ncname",
+    "is_ncname_all",
 ]
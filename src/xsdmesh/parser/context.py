@@ -6,6 +6,8 @@ Namespace resolution using stacked prefix mappings.
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Iterable
 from pathlib import Path
 
 from xsdmesh.constants import (
@@ -16,7 +18,15 @@ from xsdmesh.constants import (
     FormType,
 )
 from xsdmesh.exceptions import ParseError
-from xsdmesh.types.qname import QName, parse_qname
+from xsdmesh.types.qname import QName, _intern_qname, parse_qname
+from xsdmesh.utils.cache import FIFOCache
+
+# Maximum memoized resolve_qname results per context (FIFO eviction)
+_QNAME_CACHE_SIZE = 1024
+
+# Shared scope for elements without namespace declarations. Never mutated:
+# it is always pushed as not-owned, so push_namespace copies it first.
+_EMPTY_SCOPE: dict[str, str] = {}
 
 
 class ParseContext:
@@ -38,26 +48,77 @@ class ParseContext:
         final_default: Default final derivations
         in_redefine: True if inside <redefine> element (XSD 1.0)
         depth: Current nesting depth (= len(current_path))
-        errors: Accumulated non-fatal parse errors
+        errors: Accumulated non-fatal parse errors (at most max_errors)
+        max_errors: Cap on recorded errors; further errors are only counted
+        suppressed_errors: Number of errors dropped after reaching max_errors
     """
 
+    # Fixed attribute layout: no per-instance __dict__, slot descriptors for
+    # the attributes touched on every element event
+    __slots__ = (
+        "namespace_stack",
+        "_owned",
+        "_effective_ns",
+        "_path_ns",
+        "_path_local",
+        "_path_str_parts",
+        "_path_str",
+        "_ns_prefix_cache",
+        "_depth",
+        "_root_is_schema",
+        "schema_location",
+        "target_namespace",
+        "element_form_default",
+        "attribute_form_default",
+        "block_default",
+        "final_default",
+        "in_redefine",
+        "errors",
+        "max_errors",
+        "suppressed_errors",
+        "_scope_gen",
+        "_qname_cache",
+    )
+
     def __init__(
         self,
         *,
         schema_location: str | Path | None = None,
         target_namespace: str | None = None,
+        max_errors: int = 256,
     ) -> None:
         """Initialize parse context.
 
         Args:
             schema_location: Source file/URL for error reporting
             target_namespace: Target namespace from <schema> element
+            max_errors: Maximum number of errors to record (rest are counted)
         """
-        # Namespace stack: each level has prefix→URI mapping
+        # Namespace stack: each level has prefix→URI mapping. Scopes may be
+        # shared with clones (copy-on-write): _owned[i] is False until this
+        # context has its own copy of namespace_stack[i].
         self.namespace_stack: list[dict[str, str]] = []
+        self._owned: list[bool] = []
+
+        # Flattened view: prefix -> URIs bound by each scope declaring it,
+        # innermost last (O(1) resolve_prefix instead of a stack walk)
+        self._effective_ns: dict[str, list[str]] = {}
+
+        # Current element path as parallel lists (no tuple per push), plus
+        # preformatted "{ns}local" parts and the cached joined path string
+        self._path_ns: list[str] = []
+        self._path_local: list[str] = []
+        self._path_str_parts: list[str] = []
+        self._path_str: str | None = "/"
 
-        # Current element path: [(namespace, local_name), ...]
-        self.current_path: list[tuple[str, str]] = []
+        # Namespace URI -> interned "{uri}" prefix for path parts (a schema
+        # has only a handful of namespaces)
+        self._ns_prefix_cache: dict[str, str] = {}
+
+        # Depth counter and "root is <xs:schema>" flag, kept in push/pop so
+        # depth and is_at_schema_root never touch the path lists
+        self._depth = 0
+        self._root_is_schema = False
 
         # Schema-level attributes
         self.schema_location = str(schema_location) if schema_location else None
@@ -74,8 +135,14 @@ class ParseContext:
         # State flags
         self.in_redefine = False
 
-        # Error accumulation
+        # Error accumulation (bounded; overflow is only counted)
         self.errors: list[ParseError] = []
+        self.max_errors = max_errors
+        self.suppressed_errors = 0
+
+        # resolve_qname memo; _scope_gen changes whenever prefix bindings change
+        self._scope_gen = 0
+        self._qname_cache: FIFOCache[tuple[str, str, int], QName] = FIFOCache(_QNAME_CACHE_SIZE)
 
         # Initialize with XML built-in namespaces
         self._init_builtin_namespaces()
@@ -89,44 +156,84 @@ class ParseContext:
             "xsd": XSD_NAMESPACE,
         }
         self.namespace_stack.append(builtin_ns)
+        self._owned.append(True)
+        for prefix, uri in builtin_ns.items():
+            self._effective_ns[prefix] = [uri]
+
+    @property
+    def current_path(self) -> list[tuple[str, str]]:
+        """Element path from root to current as (namespace, local_name) tuples."""
+        return list(zip(self._path_ns, self._path_local, strict=True))
 
     @property
     def depth(self) -> int:
         """Current nesting depth (number of elements from root)."""
-        return len(self.current_path)
+        return self._depth
 
     @property
     def current_qname(self) -> QName | None:
         """QName of current element (top of path stack)."""
-        if not self.current_path:
+        if not self._path_local:
             return None
-        namespace, local = self.current_path[-1]
-        return QName(namespace, local)
+        return QName(self._path_ns[-1], self._path_local[-1])
+
+    def _current_expanded(self) -> str | None:
+        """Clark notation of current element (preformatted at push time)."""
+        parts = self._path_str_parts
+        return parts[-1] if parts else None
 
     def push_namespace(self, prefix: str, uri: str) -> None:
         """Add namespace prefix mapping to current scope.
 
+        Compatibility shim for incremental updates. At element start, pass
+        all declarations at once to push_namespace_scope() instead: one
+        scope push and one cache invalidation rather than one per prefix.
+
         Args:
             prefix: Namespace prefix (e.g., "xs", "tns")
             uri: Namespace URI
         """
         if not self.namespace_stack:
             self.namespace_stack.append({})
+            self._owned.append(True)
+
+        # Copy a scope shared with a clone before its first mutation
+        if not self._owned[-1]:
+            self.namespace_stack[-1] = dict(self.namespace_stack[-1])
+            self._owned[-1] = True
 
         # Add to current scope (top of stack)
-        self.namespace_stack[-1][prefix] = uri
+        scope = self.namespace_stack[-1]
+        if prefix in scope:
+            # Rebinding within the same scope replaces its effective entry
+            self._effective_ns[prefix][-1] = uri
+        else:
+            self._effective_ns.setdefault(prefix, []).append(uri)
+        scope[prefix] = uri
+        self._scope_gen += 1
 
     def push_namespace_scope(self, mappings: dict[str, str] | None = None) -> None:
         """Push new namespace scope level.
 
         Creates a new namespace context for nested element.
         Inherits all parent mappings implicitly via lookup chain.
+        Callers should pass all of an element's declarations in one call.
 
         Args:
             mappings: Initial prefix→URI mappings for this scope
         """
-        new_scope: dict[str, str] = dict(mappings) if mappings else {}
-        self.namespace_stack.append(new_scope)
+        if not mappings:
+            # No declarations: share the empty sentinel (no allocation)
+            self.namespace_stack.append(_EMPTY_SCOPE)
+            self._owned.append(False)
+            return
+
+        self.namespace_stack.append(dict(mappings))
+        self._owned.append(True)
+        effective = self._effective_ns
+        for prefix, uri in mappings.items():
+            effective.setdefault(prefix, []).append(uri)
+        self._scope_gen += 1
 
     def pop_namespace_scope(self) -> None:
         """Pop namespace scope level when exiting element.
@@ -138,12 +245,23 @@ class ParseContext:
             msg = "Cannot pop root namespace scope"
             raise ParseError(msg, file_path=self.schema_location)
 
-        self.namespace_stack.pop()
+        self._owned.pop()
+        scope = self.namespace_stack.pop()
+        if scope:
+            # Unbind exactly the prefixes this scope declared
+            effective = self._effective_ns
+            for prefix in scope:
+                uris = effective[prefix]
+                uris.pop()
+                if not uris:
+                    del effective[prefix]
+            self._scope_gen += 1
 
     def resolve_prefix(self, prefix: str) -> str | None:
-        """Resolve namespace prefix to URI using stack lookup.
+        """Resolve namespace prefix to URI.
 
-        Searches from current scope upward through parent scopes.
+        Innermost binding wins (current scope, then parent scopes); served
+        from the flattened prefix view in O(1).
 
         Args:
             prefix: Namespace prefix to resolve
@@ -151,11 +269,8 @@ class ParseContext:
         Returns:
             Namespace URI or None if prefix undefined
         """
-        # Search from current scope up to root
-        for scope in reversed(self.namespace_stack):
-            if prefix in scope:
-                return scope[prefix]
-        return None
+        uris = self._effective_ns.get(prefix)
+        return uris[-1] if uris else None
 
     def resolve_qname(
         self,
@@ -183,23 +298,83 @@ class ParseContext:
         if default_namespace is None:
             default_namespace = self.target_namespace or ""
 
-        # Build resolver dict from namespace stack
-        resolver: dict[str, str] = {}
-        for scope in self.namespace_stack:
-            resolver.update(scope)
+        # Same text under unchanged prefix bindings resolves identically
+        key = (text, default_namespace, self._scope_gen)
+        cache = self._qname_cache
+        qname = cache.get(key)
+        if qname is not None:
+            return qname
 
         try:
-            return parse_qname(
+            # Resolve prefixes lazily against the stack (no flattened copy)
+            qname = parse_qname(
                 text,
-                resolver=resolver,
+                resolver=self.resolve_prefix,
                 default_namespace=default_namespace,
             )
         except ParseError as e:
             # Add context to error
             e.file_path = self.schema_location
-            e.element = self.current_qname.expanded if self.current_qname else None
+            e.element = self._current_expanded()
             raise
 
+        cache[key] = qname
+        return qname
+
+    def resolve_qnames(
+        self,
+        texts: Iterable[str],
+        *,
+        default_namespace: str | None = None,
+    ) -> list[QName]:
+        """Resolve several QName texts (e.g. all QName attributes of an element).
+
+        Same results as calling resolve_qname per text, with the default
+        namespace, scope generation and lookup tables bound once. Plain
+        "prefix:local" and "local" forms are resolved inline; Clark notation
+        and malformed text go through resolve_qname.
+
+        Args:
+            texts: QName texts to resolve
+            default_namespace: Override default namespace (uses target_namespace if None)
+
+        Returns:
+            Resolved QNames in input order
+
+        Raises:
+            ParseError: If a prefix is undefined
+        """
+        if default_namespace is None:
+            default_namespace = self.target_namespace or ""
+
+        cache = self._qname_cache
+        effective = self._effective_ns
+        scope_gen = self._scope_gen
+        resolve = self.resolve_qname
+        result: list[QName] = []
+        append = result.append
+
+        for text in texts:
+            key = (text, default_namespace, scope_gen)
+            qname = cache.get(key)
+            if qname is None:
+                stripped = text.strip()
+                if stripped and stripped[0] != "{":
+                    prefix, colon, local_name = stripped.partition(":")
+                    if not colon:
+                        qname = _intern_qname(default_namespace, prefix)
+                    elif prefix and local_name:
+                        uris = effective.get(prefix)
+                        if uris:
+                            qname = _intern_qname(uris[-1], local_name)
+                if qname is None:
+                    qname = resolve(text, default_namespace=default_namespace)
+                else:
+                    cache[key] = qname
+            append(qname)
+
+        return result
+
     def push_element(self, namespace: str, local_name: str) -> None:
         """Push element onto path stack when entering element.
 
@@ -207,7 +382,19 @@ class ParseContext:
             namespace: Element namespace URI
             local_name: Element local name
         """
-        self.current_path.append((namespace, local_name))
+        self._path_ns.append(namespace)
+        self._path_local.append(local_name)
+        if namespace:
+            ns_prefix = self._ns_prefix_cache.get(namespace)
+            if ns_prefix is None:
+                ns_prefix = self._ns_prefix_cache[namespace] = sys.intern("{" + namespace + "}")
+            self._path_str_parts.append(ns_prefix + local_name)
+        else:
+            self._path_str_parts.append(local_name)
+        self._path_str = None
+        self._depth += 1
+        if self._depth == 1:
+            self._root_is_schema = local_name == "schema" and namespace == XSD_NAMESPACE
 
     def pop_element(self) -> tuple[str, str] | None:
         """Pop element from path stack when exiting element.
@@ -215,9 +402,14 @@ class ParseContext:
         Returns:
             Popped (namespace, local_name) tuple or None if stack empty
         """
-        if not self.current_path:
+        if not self._path_local:
             return None
-        return self.current_path.pop()
+        self._path_str_parts.pop()
+        self._path_str = None
+        self._depth -= 1
+        if self._depth == 0:
+            self._root_is_schema = False
+        return (self._path_ns.pop(), self._path_local.pop())
 
     def get_path_str(self) -> str:
         """Get current path as slash-separated string.
@@ -225,8 +417,10 @@ class ParseContext:
         Returns:
             Path like "/{ns}schema/{ns}complexType/{ns}sequence"
         """
-        parts = [f"{{{ns}}}{local}" if ns else local for ns, local in self.current_path]
-        return "/" + "/".join(parts) if parts else "/"
+        path_str = self._path_str
+        if path_str is None:
+            path_str = self._path_str = "/" + "/".join(self._path_str_parts)
+        return path_str
 
     def is_at_schema_root(self) -> bool:
         """Check if current element is direct child of <xs:schema>.
@@ -234,11 +428,7 @@ class ParseContext:
         Returns:
             True if depth=2 and parent is XSD schema element
         """
-        return (
-            self.depth == 2
-            and len(self.current_path) >= 2
-            and self.current_path[0] == (XSD_NAMESPACE, "schema")
-        )
+        return self._depth == 2 and self._root_is_schema
 
     def add_error(
         self,
@@ -256,18 +446,26 @@ class ParseContext:
             column: Column number in source
             context: Additional error context
         """
+        # At cap: count only, before paying for ParseError construction
+        if len(self.errors) >= self.max_errors:
+            self.suppressed_errors += 1
+            return
+
         error = ParseError(
             message,
             file_path=self.schema_location,
             line=line,
             column=column,
-            element=self.current_qname.expanded if self.current_qname else None,
+            element=self._current_expanded(),
             context=context,
         )
         self.errors.append(error)
 
     def clone(self) -> ParseContext:
-        """Create deep copy of context for forking (include/import).
+        """Create independent copy of context for forking (include/import).
+
+        Namespace scopes are shared copy-on-write: a scope is copied only
+        when either context first mutates it.
 
         Returns:
             Independent copy with same state
@@ -275,11 +473,23 @@ class ParseContext:
         ctx = ParseContext(
             schema_location=self.schema_location,
             target_namespace=self.target_namespace,
+            max_errors=self.max_errors,
         )
 
-        # Deep copy stacks
-        ctx.namespace_stack = [dict(scope) for scope in self.namespace_stack]
-        ctx.current_path = list(self.current_path)
+        # Share namespace scopes copy-on-write (neither side owns them now)
+        ctx.namespace_stack = list(self.namespace_stack)
+        ctx._owned = [False] * len(self.namespace_stack)
+        self._owned = [False] * len(self.namespace_stack)
+        ctx._effective_ns = {prefix: list(uris) for prefix, uris in self._effective_ns.items()}
+
+        # Copy path stacks
+        ctx._path_ns = list(self._path_ns)
+        ctx._path_local = list(self._path_local)
+        ctx._path_str_parts = list(self._path_str_parts)
+        ctx._path_str = self._path_str
+        ctx._ns_prefix_cache = self._ns_prefix_cache  # Pure function of the URI
+        ctx._depth = self._depth
+        ctx._root_is_schema = self._root_is_schema
 
         # Copy settings
         ctx.element_form_default = self.element_form_default
@@ -299,5 +509,6 @@ class ParseContext:
             f"depth={self.depth}, "
             f"path={self.get_path_str()}, "
             f"ns_scopes={len(self.namespace_stack)}, "
-            f"errors={len(self.errors)})"
+            f"errors={len(self.errors)}, "
+            f"suppressed_errors={self.suppressed_errors})"
         )
@@ -1,30 +1,39 @@
 """Event types and EventBuffer for SAX parsing with lookahead support.
 
 Provides:
-- EventType: Enum for XML events (start, end, text)
-- Event: NamedTuple representing a single parse event
-- EventBuffer: Ring buffer with lookahead(n) capability using deque(maxlen=3)
+- EventType: String constants for XML events (start, end, text, comment)
+- Event: Slotted dataclass representing a single parse event
+- EventBuffer: Fixed-capacity SoA ring buffer with lookahead(n) capability (maxlen=3)
 """
 
 from __future__ import annotations
 
-from collections import deque
-from enum import Enum
-from typing import NamedTuple
+from array import array
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Final
 
 from lxml import etree
 
+# Line column marker: derive line from element.sourceline when materialized
+_LINE_FROM_ELEMENT: Final = -1
 
-class EventType(Enum):
-    """XML event types for SAX parsing."""
 
-    START_ELEMENT = "start"
-    END_ELEMENT = "end"
-    TEXT = "text"
-    COMMENT = "comment"
+class EventType:
+    """XML event types for SAX parsing.
 
+    Plain interned str constants (not an Enum): comparisons are str
+    identity/equality with no Enum machinery, so `is` checks are valid.
+    """
+
+    START_ELEMENT: Final = "start"
+    END_ELEMENT: Final = "end"
+    TEXT: Final = "text"
+    COMMENT: Final = "comment"
 
-class Event(NamedTuple):
+
+@dataclass(slots=True)
+class Event:
     """Single parse event from XML stream.
 
     Attributes:
@@ -35,7 +44,7 @@ class Event(NamedTuple):
         column: Column number in source
     """
 
-    type: EventType
+    type: str
     element: etree._Element | None
     text: str | None
     line: int
@@ -45,7 +54,12 @@ class Event(NamedTuple):
 class EventBuffer:
     """Ring buffer for event lookahead during parsing.
 
-    Uses deque(maxlen=3) for efficient O(1) lookahead.
+    Fixed-capacity ring in structure-of-arrays layout: one column per Event
+    field plus head/size indices. Pushing stores the fields directly
+    (push_event allocates nothing); Event objects are only built when a
+    caller looks at an event, and element line numbers are only read from
+    lxml at that point. When full, the oldest event is dropped.
+
     Critical for disambiguation:
     - <simpleType> with <restriction> vs <list> vs <union>
     - <complexType> with <simpleContent> vs <complexContent> vs compositor
@@ -58,28 +72,145 @@ class EventBuffer:
         current = buffer.consume()  # Get and advance
     """
 
+    __slots__ = (
+        "_maxlen",
+        "_current",
+        "_types",
+        "_elements",
+        "_texts",
+        "_lines",
+        "_columns",
+        "_head",
+        "_size",
+    )
+
     def __init__(self, maxlen: int = 3) -> None:
         """Initialize event buffer.
 
         Args:
             maxlen: Maximum lookahead depth (default 3)
         """
-        self._buffer: deque[Event] = deque(maxlen=maxlen)
-        self._current: Event | None = None
         self._maxlen = maxlen
+        self._current: Event | None = None
+
+        # Ring columns (slots outside [head, head + size) are stale)
+        self._types: list[str] = [EventType.START_ELEMENT] * maxlen
+        self._elements: list[etree._Element | None] = [None] * maxlen
+        self._texts: list[str | None] = [None] * maxlen
+        self._lines = array("q", [0]) * maxlen
+        self._columns = array("q", [0]) * maxlen
+        self._head = 0
+        self._size = 0
 
     @property
     def current(self) -> Event | None:
         """Current event being processed."""
         return self._current
 
+    def push_event(
+        self,
+        event_type: str,
+        element: etree._Element | None,
+        text: str | None = None,
+        line: int = _LINE_FROM_ELEMENT,
+        column: int = 0,
+    ) -> None:
+        """Add event to buffer from its fields (no Event allocation).
+
+        Args:
+            event_type: Event type
+            element: Element node (None for text/comment)
+            text: Text content (None for element events)
+            line: Line number in source; when omitted it is read lazily from
+                element.sourceline if the event is ever materialized
+            column: Column number in source
+        """
+        maxlen = self._maxlen
+        if not maxlen:
+            return
+        # Ring index wrap via conditional subtraction (indices stay < 2 * maxlen)
+        if self._size == maxlen:
+            # Full: overwrite oldest slot and advance head
+            slot = self._head
+            head = slot + 1
+            self._head = head - maxlen if head >= maxlen else head
+        else:
+            slot = self._head + self._size
+            if slot >= maxlen:
+                slot -= maxlen
+            self._size += 1
+
+        self._types[slot] = event_type
+        self._elements[slot] = element
+        self._texts[slot] = text
+        self._lines[slot] = line
+        self._columns[slot] = column
+
+    def record(self, event_type: str, element: etree._Element) -> None:
+        """Record element start/end event in the next ring slot.
+
+        Specialized push_event for the parse loop: text and column are
+        fixed (None, 0) and the line is read lazily from the element.
+
+        Args:
+            event_type: EventType.START_ELEMENT or EventType.END_ELEMENT
+            element: Element node
+        """
+        maxlen = self._maxlen
+        if not maxlen:
+            return
+        size = self._size
+        if size == maxlen:
+            slot = self._head
+            head = slot + 1
+            self._head = head - maxlen if head >= maxlen else head
+        else:
+            slot = self._head + size
+            if slot >= maxlen:
+                slot -= maxlen
+            self._size = size + 1
+
+        self._types[slot] = event_type
+        self._elements[slot] = element
+        self._texts[slot] = None
+        self._lines[slot] = _LINE_FROM_ELEMENT
+        self._columns[slot] = 0
+
     def push(self, event: Event) -> None:
         """Add event to buffer.
 
         Args:
             event: Event to add
         """
-        self._buffer.append(event)
+        self.push_event(event.type, event.element, event.text, event.line, event.column)
+
+    def push_many(self, events: Iterable[Event]) -> None:
+        """Add several events to buffer.
+
+        Equivalent to pushing each event in order; events that would be
+        dropped immediately (all but the last maxlen) are skipped.
+
+        Args:
+            events: Events to add, oldest first
+        """
+        batch = events if isinstance(events, list) else list(events)
+        push_event = self.push_event
+        for event in batch[-self._maxlen :] if self._maxlen else ():
+            push_event(event.type, event.element, event.text, event.line, event.column)
+
+    def _event_at(self, slot: int) -> Event:
+        """Materialize Event stored in ring slot."""
+        element = self._elements[slot]
+        line = self._lines[slot]
+        if line == _LINE_FROM_ELEMENT:
+            line = (element.sourceline or 0) if element is not None else 0
+        return Event(
+            self._types[slot],
+            element,
+            self._texts[slot],
+            line,
+            self._columns[slot],
+        )
 
     def consume(self) -> Event | None:
         """Get next event and advance position.
@@ -87,13 +218,78 @@ class EventBuffer:
         Returns:
             Next event or None if buffer empty
         """
-        if not self._buffer:
+        if not self._size:
             self._current = None
             return None
 
-        self._current = self._buffer.popleft()
+        slot = self._head
+        self._current = self._event_at(slot)
+        self._elements[slot] = None  # Don't keep consumed elements alive
+        head = slot + 1
+        self._head = head - self._maxlen if head >= self._maxlen else head
+        self._size -= 1
         return self._current
 
+    def consume_while(self, predicate: Callable[[Event], bool]) -> list[Event]:
+        """Consume events from the front while predicate holds.
+
+        Args:
+            predicate: Test applied to the next event
+
+        Returns:
+            Consumed events in order (current is the last one, if any)
+        """
+        consumed: list[Event] = []
+        maxlen = self._maxlen
+        elements = self._elements
+        head = self._head
+        size = self._size
+        while size:
+            event = self._event_at(head)
+            if not predicate(event):
+                break
+            consumed.append(event)
+            elements[head] = None
+            head += 1
+            if head >= maxlen:
+                head -= maxlen
+            size -= 1
+        self._head = head
+        self._size = size
+        if consumed:
+            self._current = consumed[-1]
+        return consumed
+
+    def skip_whitespace_text(self) -> int:
+        """Drop whitespace-only text events from the front of the buffer.
+
+        Checks the type/text columns directly (no Event allocation); the
+        current event is left unchanged.
+
+        Returns:
+            Number of events skipped
+        """
+        maxlen = self._maxlen
+        types = self._types
+        texts = self._texts
+        head = self._head
+        size = self._size
+        text_type = EventType.TEXT
+        skipped = 0
+        while size:
+            text = texts[head]
+            if types[head] != text_type or (text and not text.isspace()):
+                break
+            texts[head] = None
+            head += 1
+            if head >= maxlen:
+                head -= maxlen
+            size -= 1
+            skipped += 1
+        self._head = head
+        self._size = size
+        return skipped
+
     def lookahead(self, n: int = 1) -> Event | None:
         """Peek at event n positions ahead without consuming.
 
@@ -103,9 +299,12 @@ class EventBuffer:
         Returns:
             Event at position n or None if not available
         """
-        if n < 1 or n > len(self._buffer):
+        if n < 1 or n > self._size:
             return None
-        return self._buffer[n - 1]
+        slot = self._head + n - 1
+        if slot >= self._maxlen:
+            slot -= self._maxlen
+        return self._event_at(slot)
 
     def can_lookahead(self, n: int) -> bool:
         """Check if lookahead of n positions is possible.
@@ -116,17 +315,21 @@ class EventBuffer:
         Returns:
             True if lookahead is possible
         """
-        return 1 <= n <= len(self._buffer)
+        return 1 <= n <= self._size
 
     def clear(self) -> None:
         """Clear buffer and reset current."""
-        self._buffer.clear()
+        self._elements[:] = [None] * self._maxlen
+        self._texts[:] = [None] * self._maxlen
+        self._head = 0
+        self._size = 0
         self._current = None
 
     def __len__(self) -> int:
         """Number of events in buffer."""
-        return len(self._buffer)
+        return self._size
 
     def __repr__(self) -> str:
         """Debug representation."""
-        return f"EventBuffer(current={self._current}, buffer={list(self._buffer)})"
+        events = [self.lookahead(i) for i in range(1, self._size + 1)]
+        return f"EventBuffer(current={self._current}, buffer={events})"
@@ -1,11 +1,13 @@
 """SAX-based streaming XML parser with O(depth) memory complexity.
 
 Algorithm: Incremental SAX with Selective Tree Building
-- Modified SAX using lxml.iterparse for streaming events
+- Modified SAX using lxml's pull parser (fed in chunks) for streaming events
+- Only XSD-namespace elements are reported (tag filter applied inside lxml);
+  foreign content such as documentation/appinfo markup never reaches Python
 - Selective tree building: keep annotations, stream structure elements
 - Incremental elem.clear(keep_tail=True) for memory control after each end_element
-- Event buffer (deque maxlen=3) with lookahead for disambiguation
-- Memory threshold with periodic parent.clear() every N elements
+- Event buffer (fixed-capacity ring, maxlen=3) with lookahead for disambiguation
+- Finished previous siblings are deleted on each end_element (fast_iter)
 
 Memory: O(depth) not O(nodes) - critical for large schemas (100K+ elements).
 Complexity: O(n) time, O(depth) space where depth = XML nesting level.
@@ -13,6 +15,10 @@ Complexity: O(n) time, O(depth) space where depth = XML nesting level.
 
 from __future__ import annotations
 
+import mmap
+import sys
+from collections.abc import Generator
+from contextlib import closing
 from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
@@ -20,16 +26,103 @@ from typing import IO
 
 from lxml import etree
 
-from xsdmesh.exceptions import ParseError
+from xsdmesh.constants import XSD_CLARK_TAGS, XSD_NAMESPACE
+from xsdmesh.exceptions import CacheError, ParseError
 from xsdmesh.parser.context import ParseContext
-from xsdmesh.parser.events import Event, EventBuffer, EventType
+from xsdmesh.parser.events import EventBuffer, EventType
 from xsdmesh.parser.handlers import ComponentHandler
 from xsdmesh.types.qname import QName
+from xsdmesh.utils.cache import SchemaCache
 from xsdmesh.utils.logger import get_logger
 from xsdmesh.utils.profiler import profile_time
 
 logger = get_logger(__name__)
 
+# Pre-split QNames for XSD tags: the common case skips Clark-notation parsing
+_XSD_QNAMES: dict[str, QName] = {
+    tag: QName(XSD_NAMESPACE, local) for tag, local in XSD_CLARK_TAGS.items()
+}
+
+# Pull parser tag filter: every element in the XSD namespace
+_XSD_TAG_FILTER = f"{{{XSD_NAMESPACE}}}*"
+
+# Bytes fed to the pull parser per step
+_FEED_CHUNK_SIZE = 1 << 20
+
+# Shared result for elements that declare no namespaces (never mutated)
+_NO_DECLARATIONS: dict[str, str] = {}
+
+
+def _release_element(elem: etree._Element) -> None:
+    """Free a finished element and its finished previous siblings.
+
+    Args:
+        elem: Element whose end event has been handled
+    """
+    # ========================================================================
+    # CRITICAL: Clear element to maintain O(depth) memory
+    # ========================================================================
+    elem.clear(keep_tail=True)
+
+    # Drop finished previous siblings so the tree never holds more than
+    # the open ancestors and their current children
+    parent = elem.getparent()
+    if parent is not None:
+        while elem.getprevious() is not None:
+            del parent[0]
+
+
+def _nsmap_diff(
+    nsmap: dict[str | None, str],
+    parent_nsmap: dict[str | None, str],
+) -> dict[str, str]:
+    """Namespace declarations introduced by an element.
+
+    lxml's nsmap includes inherited bindings, so only entries that differ
+    from the parent's nsmap were declared on the element itself.
+
+    Args:
+        nsmap: Element nsmap (None key for the default namespace)
+        parent_nsmap: Parent element nsmap (empty for the root)
+
+    Returns:
+        Dict of prefix→URI mappings ("" for the default namespace), URIs
+        interned so later namespace comparisons are identity checks
+    """
+    if nsmap == parent_nsmap:
+        return _NO_DECLARATIONS
+    return {
+        prefix or "": sys.intern(uri)
+        for prefix, uri in nsmap.items()
+        if parent_nsmap.get(prefix) != uri
+    }
+
+
+def _read_chunks(source: Path | IO[bytes]) -> Generator[bytes]:
+    """Yield source bytes in _FEED_CHUNK_SIZE pieces.
+
+    Files are memory-mapped and sliced (no intermediate read buffer);
+    file-like objects are read chunk by chunk.
+
+    Args:
+        source: Schema file path or binary file-like object
+
+    Yields:
+        Consecutive chunks of the document
+    """
+    if isinstance(source, Path):
+        with source.open("rb") as f:
+            size = source.stat().st_size
+            if not size:
+                return  # mmap cannot map empty files
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for offset in range(0, size, _FEED_CHUNK_SIZE):
+                    yield mapped[offset : offset + _FEED_CHUNK_SIZE]
+        return
+
+    while chunk := source.read(_FEED_CHUNK_SIZE):
+        yield chunk
+
 
 @dataclass
 class ParseResult:
@@ -50,7 +143,7 @@ class SAXParser:
     """Streaming SAX parser for XSD schemas with O(depth) memory.
 
     Features:
-    - Incremental parsing via lxml.iterparse
+    - Incremental parsing via lxml.XMLPullParser
     - Event buffer for lookahead (disambiguation)
     - Automatic elem.clear() for memory control
     - Namespace-aware QName resolution
@@ -64,45 +157,28 @@ class SAXParser:
     def __init__(
         self,
         *,
-        memory_threshold: int = 1000,
         strict: bool = False,
     ) -> None:
         """Initialize SAX parser.
 
         Args:
-            memory_threshold: Number of elements before aggressive clear
             strict: If True, fail fast on first error; if False, accumulate errors
         """
-        self._memory_threshold = memory_threshold
         self._strict = strict
 
         # State
         self._context: ParseContext | None = None
         self._event_buffer: EventBuffer | None = None
-        self._elements_since_clear = 0
-
-        # Handler registry (populated later)
-        self._handlers: dict[str, ComponentHandler] = {}
-
-    def _extract_namespaces(self, elem: etree._Element) -> dict[str, str]:
-        """Extract namespace declarations from element.
+        self._nsmap_stack: list[dict[str | None, str]] = []
 
-        Args:
-            elem: Element to inspect
-
-        Returns:
-            Dict of prefix→URI mappings from xmlns attributes
-        """
-        namespaces: dict[str, str] = {}
+        # Per open element: whether it pushed a namespace scope
+        self._pushed_scope: list[bool] = []
 
-        # lxml stores nsmap on element
-        if hasattr(elem, "nsmap") and elem.nsmap:
-            for prefix, uri in elem.nsmap.items():
-                # None prefix means default namespace
-                prefix_key = prefix if prefix is not None else ""
-                namespaces[prefix_key] = uri
+        # Tag string -> QName memo (a schema has only a few distinct tags)
+        self._qname_cache: dict[str, QName] = dict(_XSD_QNAMES)
 
-        return namespaces
+        # Handler registry keyed by Clark tag "{ns}local" (populated later)
+        self._handlers: dict[object, ComponentHandler] = {}
 
     def _get_qname(self, elem: etree._Element) -> QName:
         """Extract QName from element.
@@ -117,14 +193,20 @@ class SAXParser:
         tag = elem.tag
 
         if isinstance(tag, str):
+            # Fast path: memoized per tag (preseeded with the XSD vocabulary)
+            qname = self._qname_cache.get(tag)
+            if qname is not None:
+                return qname
+
             if tag.startswith("{"):
                 # Clark notation: "{http://...}local"
                 ns_end = tag.find("}")
-                namespace = tag[1:ns_end]
-                local = tag[ns_end + 1 :]
-                return QName(namespace, local)
-            # No namespace
-            return QName("", tag)
+                qname = QName(sys.intern(tag[1:ns_end]), sys.intern(tag[ns_end + 1 :]))
+            else:
+                # No namespace
+                qname = QName("", sys.intern(tag))
+            self._qname_cache[tag] = qname
+            return qname
 
         # Should not happen with well-formed XML
         msg = f"Unexpected tag type: {type(tag)}"
@@ -145,18 +227,24 @@ class SAXParser:
         """
         qname = self._get_qname(elem)
 
-        # Push new namespace scope with declarations from this element
-        ns_declarations = self._extract_namespaces(elem)
+        # Push namespace scope only for elements that declare namespaces:
+        # diff against the parent's nsmap kept on a stack (lxml builds a new
+        # nsmap dict per access, so the parent's is not re-read)
+        nsmap = elem.nsmap
+        nsmap_stack = self._nsmap_stack
+        ns_declarations = _nsmap_diff(nsmap, nsmap_stack[-1] if nsmap_stack else {})
+        nsmap_stack.append(nsmap)
         if ns_declarations:
             context.push_namespace_scope(ns_declarations)
+            self._pushed_scope.append(True)
         else:
-            context.push_namespace_scope()
+            self._pushed_scope.append(False)
 
         # Push element onto path stack
         context.push_element(qname.namespace, qname.local_name)
 
-        # Dispatch to handler if registered
-        handler = self._handlers.get(qname.local_name)
+        # Dispatch to handler if registered (keyed by the raw Clark tag)
+        handler = self._handlers.get(elem.tag)
         if handler:
             try:
                 handler.start_element(elem, context, buffer)
@@ -166,7 +254,7 @@ class SAXParser:
                 logger.warning(f"Handler error in {qname.local_name}.start_element: {e}")
                 context.add_error(
                     f"Handler error: {e}",
-                    line=elem.sourceline if hasattr(elem, "sourceline") else None,
+                    line=elem.sourceline,
                 )
 
     def _handle_end_element(
@@ -184,45 +272,31 @@ class SAXParser:
             context: Parse context
             buffer: Event buffer
         """
-        qname = self._get_qname(elem)
-
-        # Dispatch to handler if registered
-        handler = self._handlers.get(qname.local_name)
+        # Dispatch to handler if registered; the QName is only needed for
+        # the log message, so the tag is not split on the common path
+        handler = self._handlers.get(elem.tag)
         if handler:
             try:
                 handler.end_element(elem, context, buffer)
             except Exception as e:
                 if self._strict:
                     raise
-                logger.warning(f"Handler error in {qname.local_name}.end_element: {e}")
+                local_name = self._get_qname(elem).local_name
+                logger.warning(f"Handler error in {local_name}.end_element: {e}")
                 context.add_error(
                     f"Handler error: {e}",
-                    line=elem.sourceline if hasattr(elem, "sourceline") else None,
+                    line=elem.sourceline,
                 )
 
         # Pop element from path stack
         context.pop_element()
 
-        # Pop namespace scope
-        try:
+        # Pop namespace scope if this element pushed one
+        self._nsmap_stack.pop()
+        if self._pushed_scope.pop():
             context.pop_namespace_scope()
-        except ParseError:
-            # Root namespace scope - don't pop
-            pass
-
-        # ========================================================================
-        # CRITICAL: Clear element to maintain O(depth) memory
-        # ========================================================================
-        elem.clear(keep_tail=True)
-        self._elements_since_clear += 1
-
-        # Periodic aggressive cleanup
-        if self._elements_since_clear >= self._memory_threshold:
-            parent = elem.getparent()
-            if parent is not None:
-                parent.clear()
-            self._elements_since_clear = 0
-            logger.debug(f"Memory threshold reached: cleared parent at depth {context.depth}")
+
+        _release_element(elem)
 
     @profile_time
     def parse(
@@ -250,7 +324,9 @@ class SAXParser:
             target_namespace=target_namespace,
         )
         self._event_buffer = EventBuffer()
-        self._elements_since_clear = 0
+        self._nsmap_stack = []
+        self._pushed_scope = []
+        self._qname_cache = dict(_XSD_QNAMES)
         elements_count = 0
 
         # Prepare source for lxml
@@ -259,48 +335,81 @@ class SAXParser:
             if not source_path.exists():
                 msg = f"Schema file not found: {source}"
                 raise ParseError(msg, file_path=str(source))
-            source_input: str | IO[bytes] = str(source_path)
+            source_input: Path | IO[bytes] = source_path
         else:
             source_input = source
 
         try:
             # ===================================================================
-            # lxml.iterparse: streaming SAX parser
+            # lxml pull parser: streaming SAX parser fed in chunks
             # ===================================================================
-            parser_context = etree.iterparse(
-                source_input,
+            pull_parser = etree.XMLPullParser(
                 events=("start", "end"),
+                tag=_XSD_TAG_FILTER,  # Skip foreign elements in C
                 huge_tree=True,  # Allow large schemas
+                collect_ids=False,  # No ID attribute hash table
+                resolve_entities=False,  # XSD never needs entity expansion
+                no_network=True,  # Never fetch external DTDs/entities
+                remove_blank_text=True,  # Drop ignorable whitespace in libxml2
+                remove_comments=True,  # Comments are never dispatched
             )
-
-            for raw_event, elem in parser_context:
-                # Convert to our Event type
-                event_type = (
-                    EventType.START_ELEMENT if raw_event == "start" else EventType.END_ELEMENT
-                )
-
-                line = (
-                    elem.sourceline
-                    if hasattr(elem, "sourceline") and elem.sourceline is not None
-                    else 0
-                )
-                event = Event(
-                    type=event_type,
-                    element=elem,
-                    text=None,
-                    line=line,
-                    column=0,  # lxml doesn't provide column
-                )
-
-                # Push to event buffer for lookahead
-                self._event_buffer.push(event)
-
-                # Process event
-                if event_type == EventType.START_ELEMENT:
-                    self._handle_start_element(elem, self._context, self._event_buffer)
-                    elements_count += 1
-                elif event_type == EventType.END_ELEMENT:
-                    self._handle_end_element(elem, self._context, self._event_buffer)
+            feed = pull_parser.feed
+            read_events = pull_parser.read_events
+
+            # Hot loop: bind attributes and methods to locals once
+            context = self._context
+            buffer = self._event_buffer
+            record = buffer.record
+            handle_start = self._handle_start_element
+            handle_end = self._handle_end_element
+            handlers = self._handlers
+            start_type = EventType.START_ELEMENT
+            end_type = EventType.END_ELEMENT
+
+            # Start event not yet dispatched: it is held until the next event
+            # shows whether the element is a leaf (its own end comes next)
+            pending: etree._Element | None = None
+
+            # Feed one chunk (or close at end of input), then drain its
+            # events. Each branch records the event in a preallocated ring
+            # slot for lookahead (no Event allocation; line is read from
+            # elem.sourceline only if materialized), then dispatches
+            with closing(_read_chunks(source_input)) as chunks:
+                while True:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        pull_parser.close()  # Raises on truncated input
+                    else:
+                        feed(chunk)
+
+                    for raw_event, elem in read_events():
+                        if raw_event == "start":
+                            # A child starts: the held element has children
+                            if pending is not None:
+                                record(start_type, pending)
+                                handle_start(pending, context, buffer)
+                            pending = elem
+                            elements_count += 1
+                        elif pending is not None:
+                            # End right after a start is that element's own
+                            # end: a leaf, so both are dispatched together
+                            pending = None
+                            record(start_type, elem)
+                            if elem.tag in handlers:
+                                handle_start(elem, context, buffer)
+                                record(end_type, elem)
+                                handle_end(elem, context, buffer)
+                            else:
+                                # Path and namespace pushes would be undone
+                                # at once with nothing observing them
+                                record(end_type, elem)
+                                _release_element(elem)
+                        else:
+                            record(end_type, elem)
+                            handle_end(elem, context, buffer)
+
+                    if chunk is None:
+                        break
 
             # Parsing complete
             logger.info(
@@ -334,40 +443,81 @@ class SAXParser:
     def register_handler(self, tag: str, handler: ComponentHandler) -> None:
         """Register handler for element tag.
 
+        Handlers are stored under the Clark tag so dispatch can use
+        ``elem.tag`` directly. A bare local name is taken to be in the XSD
+        namespace.
+
         Args:
-            tag: Element local name (e.g., "simpleType")
+            tag: Clark tag (e.g., "{http://...}simpleType") or XSD local name
+                (e.g., "simpleType")
             handler: Handler instance with start_element/end_element methods
+
+        Raises:
+            ValueError: If tag is in another namespace; the parser skips
+                elements outside the XSD namespace, so it would never fire
         """
-        self._handlers[tag] = handler
+        if not tag.startswith("{"):
+            tag = f"{{{XSD_NAMESPACE}}}{tag}"
+        elif not tag.startswith(f"{{{XSD_NAMESPACE}}}"):
+            msg = f"Handler tag must be in the XSD namespace: {tag}"
+            raise ValueError(msg)
+        self._handlers[sys.intern(tag)] = handler
 
     def __repr__(self) -> str:
         """Debug representation."""
-        return (
-            f"SAXParser("
-            f"handlers={len(self._handlers)}, "
-            f"threshold={self._memory_threshold}, "
-            f"strict={self._strict})"
-        )
+        return f"SAXParser(handlers={len(self._handlers)}, strict={self._strict})"
 
 
 def parse_schema(
     source: str | Path | IO[bytes],
     *,
     strict: bool = False,
+    cache: SchemaCache[ParseResult] | None = None,
 ) -> ParseResult:
     """Convenience function to parse XSD schema.
 
     Args:
         source: File path, URL, or file-like object
         strict: Fail fast on errors
+        cache: On-disk cache; unchanged schemas are loaded without parsing.
+            An unreadable entry is removed and the schema reparsed
 
     Returns:
         ParseResult with context, errors, and element count
 
+    Raises:
+        CacheError: If a cache entry cannot be removed or written
+
     Example:
         result = parse_schema("schema.xsd")
         errors = result.errors
         count = result.elements_processed
     """
     parser = SAXParser(strict=strict)
-    return parser.parse(source)
+    if cache is None:
+        return parser.parse(source)
+
+    # Key on content + location (results carry schema_location)
+    if isinstance(source, (str, Path)):
+        if not Path(source).exists():
+            return parser.parse(source)  # Raises ParseError
+        content = Path(source).read_bytes()
+        key = cache.key(content, str(source))
+    else:
+        content = source.read()
+        source = BytesIO(content)
+        key = cache.key(content)
+
+    try:
+        cached = cache.load(key)
+    except CacheError:
+        # Corrupt entry: a miss; drop it so it is rewritten below
+        cache.invalidate(key)
+        cached = None
+    # An entry that unpickles to something else is corrupt too
+    if isinstance(cached, ParseResult):
+        return cached
+
+    result = parser.parse(source)
+    cache.store(key, result)
+    return result
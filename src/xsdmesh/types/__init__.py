@@ -12,13 +12,16 @@ from xsdmesh.types.base import (
     ValidationResult,
 )
 from xsdmesh.types.facets import (
+    CompiledLexicalFacets,
+    CompiledValueFacets,
+    EnumerationSet,
     FacetResult,
     FacetValidator,
     LexicalFacets,
     ValueFacets,
     WhitespaceFacet,
 )
-from xsdmesh.types.qname import QName, is_ncname, parse_qname, split_qname
+from xsdmesh.types.qname import QName, is_ncname, is_ncname_all, parse_qname, split_qname
 from xsdmesh.types.registry import ComponentRegistry, RegistryStats
 from xsdmesh.types.storage import (
     DictStorage,
@@ -46,6 +49,9 @@ __all__ = [
     "TrieStorage",
     "create_storage",
     # Facets
+    "CompiledLexicalFacets",
+    "CompiledValueFacets",
+    "EnumerationSet",
     "FacetResult",
     "FacetValidator",
     "LexicalFacets",
@@ -56,4 +62,5 @@ __all__ = [
     "parse_qname",
     "split_qname",
     "is_ncname",
+    "is_ncname_all",
 ]
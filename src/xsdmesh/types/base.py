@@ -8,16 +8,16 @@ Uses Python 3.10+ match/case for structural pattern matching instead of visitor
 
 from __future__ import annotations
 
-import weakref
 from abc import ABC, abstractmethod
+from collections import ChainMap
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Literal, Protocol, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, NoReturn, Protocol, TypeVar
 
 from xsdmesh.exceptions import FrozenError, ResolutionError, ValidationError
 from xsdmesh.types.qname import QName
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping, MutableMapping
     from typing import Self
 
 
@@ -68,7 +68,7 @@ class Component(ABC):
     - QName identity (namespace, name)
     - Validation interface
     - apply() hook for extensibility (use with match/case)
-    - Weak references for annotations
+    - Annotations owned as an immutable tuple
 
     Lifecycle:
     1. Create mutable component during parsing
@@ -76,6 +76,10 @@ class Component(ABC):
     3. freeze() after complete initialization
     4. Immutable in Registry for thread-safety
 
+    Mutable components use plain object attribute writes (no __setattr__
+    override); freeze() swaps the instance to a per-class frozen variant
+    whose __setattr__ always raises FrozenError.
+
     Extensibility via apply():
         def to_json(comp: Component) -> dict:
             match comp:
@@ -87,6 +91,11 @@ class Component(ABC):
         result = component.apply(to_json)
     """
 
+    __slots__ = ("name", "target_namespace", "_annotations", "__weakref__")
+
+    # True only on frozen variants (see _frozen_class)
+    _frozen: ClassVar[bool] = False
+
     def __init__(
         self,
         *,
@@ -99,18 +108,13 @@ class Component(ABC):
         Args:
             name: Local name (None for anonymous components)
             target_namespace: Namespace URI
-            annotations: xs:annotation elements (stored as weak refs)
+            annotations: xs:annotation elements
         """
-        # Set _frozen first to allow initial attribute setting
-        object.__setattr__(self, "_frozen", False)
-
         self.name = name
         self.target_namespace = target_namespace
 
-        # Store annotations as weak references to prevent memory leaks
-        self._annotation_refs: list[weakref.ref[Any]] = []
-        if annotations:
-            self._annotation_refs = [weakref.ref(a) for a in annotations]
+        # Annotations share the component's lifetime: own them directly
+        self._annotations: tuple[Any, ...] = tuple(annotations) if annotations else ()
 
     @property
     def qname(self) -> QName:
@@ -122,18 +126,46 @@ class Component(ABC):
         return QName(self.target_namespace or "", self.name or "")
 
     @property
-    def annotations(self) -> list[Any]:
-        """Get annotations (dereferencing weak refs).
+    def annotations(self) -> tuple[Any, ...]:
+        """Get annotations.
 
         Returns:
-            List of alive annotation objects
+            Tuple of annotation objects in document order
         """
-        return [ref() for ref in self._annotation_refs if ref() is not None]
+        return self._annotations
 
     @property
     def is_frozen(self) -> bool:
         """Check if component is immutable."""
-        return getattr(self, "_frozen", False)
+        return self._frozen
+
+    @classmethod
+    def _frozen_class(cls) -> type[Component]:
+        """Frozen variant of this class, created once per class.
+
+        Same name and layout (empty __slots__), so instances can switch to it
+        via __class__ assignment; only attribute writes and pickling differ.
+
+        Returns:
+            Subclass of cls whose instances reject attribute writes
+        """
+        frozen_cls: type[Component] | None = cls.__dict__.get("_frozen_variant")
+        if frozen_cls is None:
+            metaclass: Any = type(cls)  # ABCMeta (or a subclass of it)
+            frozen_cls = metaclass(
+                cls.__name__,
+                (cls,),
+                {
+                    "__slots__": (),
+                    "__module__": cls.__module__,
+                    "__qualname__": cls.__qualname__,
+                    "_frozen": True,
+                    "__setattr__": _reject_setattr,
+                    "__reduce__": _reduce_frozen,
+                },
+            )
+            cls._frozen_variant = frozen_cls  # type: ignore[attr-defined]
+        return frozen_cls
 
     def freeze(self) -> None:
         """Make component immutable.
@@ -141,11 +173,11 @@ class Component(ABC):
         Recursively freezes all child components.
         Call after complete initialization.
         """
-        if self.is_frozen:
+        if self._frozen:
             return
 
-        # Freeze self
-        object.__setattr__(self, "_frozen", True)
+        # Freeze self: switch to frozen variant (one-way)
+        self.__class__ = self._frozen_class()
 
         # Freeze children (override in subclasses)
         self._freeze_children()
@@ -170,22 +202,6 @@ class Component(ABC):
         """
         pass
 
-    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
-        """Prevent attribute modification after freeze.
-
-        Args:
-            name: Attribute name
-            value: Attribute value
-
-        Raises:
-            FrozenError: If component is frozen and attribute is not _frozen
-        """
-        if name == "_frozen" or not self.is_frozen:
-            object.__setattr__(self, name, value)
-        else:
-            msg = f"Cannot modify frozen component: {self.qname}"
-            raise FrozenError(msg)
-
     @abstractmethod
     def validate(self, value: Any, context: ValidationContext) -> ValidationResult:  # noqa: ANN401
         """Validate value against this component.
@@ -228,7 +244,34 @@ class Component(ABC):
         return f"{self.__class__.__name__}({self.qname}){frozen}"
 
 
-@dataclass
+def _reject_setattr(self: Component, name: str, value: Any) -> NoReturn:  # noqa: ANN401
+    """__setattr__ of frozen Component variants.
+
+    Raises:
+        FrozenError: Always
+    """
+    msg = f"Cannot modify frozen component: {self.qname}"
+    raise FrozenError(msg)
+
+
+def _reduce_frozen(self: Component) -> tuple[Any, ...]:
+    """__reduce__ of frozen Component variants (pickle via the mutable class)."""
+    return (_restore_frozen, (type(self).__mro__[1], self.__getstate__()))
+
+
+def _restore_frozen(cls: type[Component], state: Any) -> Component:  # noqa: ANN401
+    """Rebuild a frozen component from its mutable class and pickled state."""
+    component = cls.__new__(cls)
+    dict_state, slot_state = state if isinstance(state, tuple) else (state, None)
+    if dict_state:
+        component.__dict__.update(dict_state)
+    for name, value in (slot_state or {}).items():
+        object.__setattr__(component, name, value)
+    component.__class__ = cls._frozen_class()
+    return component
+
+
+@dataclass(slots=True)
 class TypeReference:
     """Lazy reference to a type component.
 
@@ -258,23 +301,54 @@ class TypeReference:
             ResolutionError: If QName cannot be resolved in registry
         """
         # Return cached if already resolved
-        if self._resolved is not None:
-            return self._resolved
+        component = self._resolved
+        if component is not None:
+            return component
 
         # Lookup in registry
-        component: Component | None = registry.lookup(self.ref_qname)
+        component = registry.lookup(self.ref_qname)
         if component is None:
-            msg = "Cannot resolve type reference"
-            raise ResolutionError(
-                msg,
-                qname=str(self.ref_qname),
-                reference_type="type",
-            )
+            raise self._unresolved_error()
 
         # Cache and return
         self._resolved = component
         return component
 
+    def resolve_from(self, components: Mapping[QName, Component]) -> Component:
+        """Resolve QName against a plain QName -> component mapping.
+
+        Same caching and errors as resolve(), but one mapping lookup instead
+        of a registry method call (for callers holding a symbol table dict).
+
+        Args:
+            components: Mapping of QName to component
+
+        Returns:
+            Resolved component (cached after first resolution)
+
+        Raises:
+            ResolutionError: If QName is not in the mapping
+        """
+        component = self._resolved
+        if component is not None:
+            return component
+
+        component = components.get(self.ref_qname)
+        if component is None:
+            raise self._unresolved_error()
+
+        self._resolved = component
+        return component
+
+    def _unresolved_error(self) -> ResolutionError:
+        """Build error for a reference that cannot be resolved."""
+        msg = "Cannot resolve type reference"
+        return ResolutionError(
+            msg,
+            qname=str(self.ref_qname),
+            reference_type="type",
+        )
+
     @property
     def is_resolved(self) -> bool:
         """Check if reference has been resolved.
@@ -300,16 +374,19 @@ class ValidationContext:
     - ID/IDREF map for key constraints
     - Current path for error reporting
     - Error accumulation (strict vs permissive mode)
+
+    Errors are stored column-wise (message, code, severity, context) and
+    materialized as ValidationError objects only when ``errors`` is read.
     """
 
     # Schema registry for type lookups (uses Protocol for type safety)
     registry: ComponentLookup | None = None
 
-    # Active namespace prefixes
-    namespaces: dict[str, str] = field(default_factory=dict)
+    # Active namespace prefixes (ChainMap overlay in clones)
+    namespaces: MutableMapping[str, str] = field(default_factory=dict)
 
-    # ID -> element mapping for keyref validation
-    id_map: dict[str, Any] = field(default_factory=dict)
+    # ID -> element mapping for keyref validation (ChainMap overlay in clones)
+    id_map: MutableMapping[str, Any] = field(default_factory=dict)
 
     # XPath-like path for error reporting
     path: list[str] = field(default_factory=list)
@@ -317,8 +394,48 @@ class ValidationContext:
     # Fail-fast (True) vs accumulate errors (False)
     strict: bool = True
 
-    # Accumulated errors (used when strict=False)
-    errors: list[ValidationError] = field(default_factory=list)
+    # Accumulated errors (used when strict=False), one list per field
+    _err_messages: list[str] = field(default_factory=list, init=False, repr=False)
+    _err_codes: list[str | None] = field(default_factory=list, init=False, repr=False)
+    _err_severities: list[Literal["error", "warning", "info"]] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _err_contexts: list[str | None] = field(default_factory=list, init=False, repr=False)
+
+    # ValidationError objects built so far (prefix of the columns above)
+    _materialized: tuple[ValidationError, ...] = field(default=(), init=False, repr=False)
+
+    @property
+    def errors(self) -> tuple[ValidationError, ...]:
+        """Accumulated errors, materialized on first access.
+
+        Read-only: the same tuple is returned until add_error is called
+        again, so repeated reads are free, and each error object is built
+        once.
+
+        Returns:
+            Tuple of ValidationError in the order they were added
+        """
+        materialized = self._materialized
+        start = len(materialized)
+        if start == len(self._err_messages):
+            return materialized
+        materialized += tuple(
+            ValidationError(
+                self._err_messages[i],
+                code=self._err_codes[i],
+                severity=self._err_severities[i],
+                context=self._err_contexts[i],
+            )
+            for i in range(start, len(self._err_messages))
+        )
+        self._materialized = materialized
+        return materialized
+
+    @property
+    def error_count(self) -> int:
+        """Number of accumulated errors (without materializing them)."""
+        return len(self._err_messages)
 
     def add_error(
         self,
@@ -334,13 +451,10 @@ class ValidationContext:
             code: W3C error code
             severity: Error severity level
         """
-        error = ValidationError(
-            message,
-            code=code,
-            severity=severity,
-            context="/".join(self.path) if self.path else None,
-        )
-        self.errors.append(error)
+        self._err_messages.append(message)
+        self._err_codes.append(code)
+        self._err_severities.append(severity)
+        self._err_contexts.append("/".join(self.path) if self.path else None)
 
     def push_path(self, segment: str) -> None:
         """Push path segment for nested validation.
@@ -356,27 +470,40 @@ class ValidationContext:
         Returns:
             Popped segment or None if empty
         """
-        return self.path.pop() if self.path else None
+        if not self.path:
+            return None
+        return self.path.pop()
 
     def clone(self) -> ValidationContext:
-        """Create independent copy for nested validation.
+        """Create a child context for nested validation.
+
+        Path and errors are copied. Namespaces and ID map are not: the clone
+        gets an empty ChainMap layer over the parent's live mappings. Its
+        writes stay local, but lookups fall through to the parent, so
+        entries the parent adds after cloning are visible in the clone, and
+        deleting an inherited key through the clone raises KeyError.
 
         Returns:
-            New context with same registry and namespaces
+            New context with same registry, layered over this one's mappings
         """
-        return ValidationContext(
+        cloned = ValidationContext(
             registry=self.registry,
-            namespaces=dict(self.namespaces),
-            id_map=dict(self.id_map),
+            namespaces=ChainMap({}, self.namespaces),
+            id_map=ChainMap({}, self.id_map),
             path=list(self.path),
             strict=self.strict,
-            errors=list(self.errors),
         )
+        cloned._err_messages = list(self._err_messages)
+        cloned._err_codes = list(self._err_codes)
+        cloned._err_severities = list(self._err_severities)
+        cloned._err_contexts = list(self._err_contexts)
+        cloned._materialized = self._materialized
+        return cloned
 
     def __repr__(self) -> str:
         """Debug representation."""
         path_str = "/".join(self.path) if self.path else "/"
-        return f"ValidationContext(path={path_str}, errors={len(self.errors)})"
+        return f"ValidationContext(path={path_str}, errors={self.error_count})"
 
 
 @dataclass
@@ -9,14 +9,22 @@ Supports two notations:
 from __future__ import annotations
 
 import re
-from typing import NamedTuple
+import sys
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
 
+from xsdmesh.constants import ALL_BUILTIN_TYPES, XSD_NAMESPACE
 from xsdmesh.exceptions import ParseError
+from xsdmesh.utils.cache import FIFOCache
 
 
-class QName(NamedTuple):
+@dataclass(slots=True, frozen=True)
+class QName:
     """Qualified Name: namespace + local name.
 
+    Immutable; the hash is computed once at construction since QNames are
+    used as dict keys throughout the symbol tables.
+
     Attributes:
         namespace: Namespace URI (empty string for no namespace)
         local_name: Local part of the name
@@ -24,6 +32,20 @@ class QName(NamedTuple):
 
     namespace: str
     local_name: str
+    _hash: int = field(init=False, repr=False, compare=False)
+    _expanded_bytes: bytes | None = field(init=False, repr=False, compare=False, default=None)
+
+    def __post_init__(self) -> None:
+        """Precompute hash of (namespace, local_name)."""
+        object.__setattr__(self, "_hash", hash((self.namespace, self.local_name)))
+
+    def __hash__(self) -> int:
+        """Return cached hash."""
+        return self._hash
+
+    def __reduce__(self) -> tuple[type[QName], tuple[str, str]]:
+        """Pickle by fields only; the hash is recomputed on load."""
+        return (QName, (self.namespace, self.local_name))
 
     @property
     def expanded(self) -> str:
@@ -32,6 +54,18 @@ class QName(NamedTuple):
             return f"{{{self.namespace}}}{self.local_name}"
         return self.local_name
 
+    @property
+    def expanded_bytes(self) -> bytes:
+        """Clark notation as UTF-8 (encoded once, then cached).
+
+        Registry Bloom filters hash this on every store and lookup.
+        """
+        data = self._expanded_bytes
+        if data is None:
+            data = self.expanded.encode("utf-8")
+            object.__setattr__(self, "_expanded_bytes", data)
+        return data
+
     def __str__(self) -> str:
         """String representation (Clark notation)."""
         return self.expanded
@@ -43,25 +77,47 @@ class QName(NamedTuple):
         return f"QName('{self.local_name}')"
 
 
-# Clark notation pattern: {namespace}localName
-_CLARK_PATTERN = re.compile(r"^\{([^}]*)\}(.+)$")
+# XSD built-in type QNames: fixed, never evicted from the flyweight pool
+_BUILTIN_QNAMES: dict[tuple[str, str], QName] = {
+    (XSD_NAMESPACE, name): QName(XSD_NAMESPACE, name) for name in sorted(ALL_BUILTIN_TYPES)
+}
+
+# Flyweight pool: parse_qname returns one shared instance per (namespace, local)
+_QNAME_POOL_SIZE = 8192
+_QNAME_POOL: FIFOCache[tuple[str, str], QName] = FIFOCache(_QNAME_POOL_SIZE)
+
+
+def _intern_qname(namespace: str, local_name: str) -> QName:
+    """Return pooled QName instance for (namespace, local_name)."""
+    key = (namespace, local_name)
+    qname = _BUILTIN_QNAMES.get(key)
+    if qname is None:
+        qname = _QNAME_POOL.get(key)
+    if qname is None:
+        qname = _QNAME_POOL[key] = QName(sys.intern(namespace), sys.intern(local_name))
+    return qname
+
+
+# Simplified NCName pattern: letter or underscore, then word chars, dash, dot
+_NCNAME_PATTERN = re.compile(r"[^\W\d][\w.\-]*")
 
 
 def parse_qname(
     text: str,
     *,
-    resolver: dict[str, str] | None = None,
+    resolver: Callable[[str], str | None] | Mapping[str, str] | None = None,
     default_namespace: str = "",
 ) -> QName:
     """Parse QName from text in Clark or prefix notation.
 
     Args:
         text: QName text ("{ns}local", "prefix:local", or "local")
-        resolver: Prefix to namespace URI mapping (for prefix notation)
+        resolver: Prefix to namespace URI mapping, or callable returning the
+            URI (None if undefined) for a prefix (for prefix notation)
         default_namespace: Default namespace for unprefixed names
 
     Returns:
-        QName tuple (namespace, local_name)
+        QName (namespace, local_name)
 
     Raises:
         ParseError: If prefix is undefined or format is invalid
@@ -76,21 +132,22 @@ def parse_qname(
         >>> parse_qname("localName", default_namespace="http://example.com")
         QName('http://example.com', 'localName')
     """
-    if not text or not text.strip():
+    text = text.strip()
+    if not text:
         msg = "QName text cannot be empty"
         raise ParseError(msg)
 
-    text = text.strip()
-
     # Clark notation: {namespace}localName
-    if match := _CLARK_PATTERN.match(text):
-        namespace, local_name = match.groups()
-        return QName(namespace, local_name)
+    if text[0] == "{":
+        namespace, brace, local_name = text[1:].partition("}")
+        if not brace or not local_name:
+            msg = f"Invalid Clark notation QName: '{text}'"
+            raise ParseError(msg)
+        return _intern_qname(namespace, local_name)
 
     # Prefix notation: prefix:localName
-    if ":" in text:
-        prefix, local_name = text.split(":", 1)
-
+    prefix, colon, local_name = text.partition(":")
+    if colon:
         if not prefix:
             msg = f"Empty prefix in QName: '{text}'"
             raise ParseError(msg)
@@ -103,15 +160,15 @@ def parse_qname(
             msg = f"No namespace resolver provided for prefixed QName: '{text}'"
             raise ParseError(msg)
 
-        if prefix not in resolver:
+        uri = resolver(prefix) if callable(resolver) else resolver.get(prefix)
+        if uri is None:
             msg = f"Undefined namespace prefix: '{prefix}' in QName: '{text}'"
             raise ParseError(msg)
 
-        namespace = resolver[prefix]
-        return QName(namespace, local_name)
+        return _intern_qname(uri, local_name)
 
     # No prefix: use default namespace
-    return QName(default_namespace, text)
+    return _intern_qname(default_namespace, prefix)
 
 
 def split_qname(text: str) -> tuple[str | None, str]:
@@ -150,10 +207,20 @@ def is_ncname(name: str) -> bool:
     Note:
         Simplified validation - full XML NCName has complex Unicode rules.
     """
-    if not name:
-        return False
-
     # Simplified: alphanumeric + underscore, dash, dot
     # First char: letter or underscore
     # Following: letter, digit, underscore, dash, dot
-    return (name[0].isalpha() or name[0] == "_") and all(c.isalnum() or c in "_-." for c in name)
+    return _NCNAME_PATTERN.fullmatch(name) is not None
+
+
+def is_ncname_all(names: Iterable[str]) -> bool:
+    """Check if every name is a valid NCName.
+
+    Args:
+        names: Names to validate (e.g. attribute values)
+
+    Returns:
+        True if all names are valid NCNames (True for empty input)
+    """
+    fullmatch = _NCNAME_PATTERN.fullmatch
+    return all(fullmatch(name) is not None for name in names)
@@ -8,8 +8,11 @@ Default storage: TrieStorage (O(k) lookup, prefix search, Bloom filter).
 
 from __future__ import annotations
 
+import sys
+from collections import defaultdict
 from collections.abc import Callable, Iterator
 from dataclasses import dataclass
+from typing import cast
 
 from xsdmesh.types.base import Component
 from xsdmesh.types.qname import QName
@@ -87,9 +90,26 @@ class ComponentRegistry[T: Component]:
                 expected_items=expected_components,
                 bloom_fp_rate=bloom_fp_rate,
             )
+        self._is_trie = isinstance(self._storage, TrieStorage)
+
+        # Bind storage read methods on the instance: callers skip the class
+        # method and the self._storage dereference on every lookup
+        backend = self._storage
+        self.lookup = backend.lookup  # type: ignore[method-assign]
+        self.by_namespace = backend.by_namespace  # type: ignore[method-assign]
+        self.by_namespace_prefix = backend.by_namespace_prefix  # type: ignore[method-assign]
+        self.namespaces = backend.namespaces  # type: ignore[method-assign]
+        self.all_components = backend.all_items  # type: ignore[method-assign]
+        self.iter_components = backend.iter_items  # type: ignore[method-assign]
+        self.iter_namespace = backend.iter_namespace  # type: ignore[method-assign]
 
         # Deferred resolution callbacks: QName -> list of callbacks
-        self._callbacks: dict[QName, list[Callable[[T], None]]] = {}
+        self._callbacks: defaultdict[QName, list[Callable[[T], None]]] = defaultdict(list)
+
+        # Cached stats snapshot, invalidated by registry mutations
+        self._cached_stats: RegistryStats | None = None
+        self._stats_dirty = True
+        self._stats_len = 0
 
     def register(self, component: T) -> None:
         """Register component in registry.
@@ -102,8 +122,11 @@ class ComponentRegistry[T: Component]:
         Raises:
             ValueError: If component with same QName already registered
         """
+        # Intern key strings: registry keys then compare by identity
         qname = component.qname
+        qname = QName(sys.intern(qname.namespace), sys.intern(qname.local_name))
         self._storage.store(qname, component)
+        self._stats_dirty = True
         self._process_callbacks(qname, component)
 
     def lookup(self, qname: QName) -> T | None:
@@ -172,6 +195,17 @@ class ComponentRegistry[T: Component]:
         """
         return self._storage.by_namespace(namespace)
 
+    def iter_namespace(self, namespace: str) -> Iterator[T]:
+        """Iterate over components in namespace without building a list.
+
+        Args:
+            namespace: Namespace URI
+
+        Returns:
+            Iterator over the components by_namespace would return
+        """
+        return self._storage.iter_namespace(namespace)
+
     def by_namespace_prefix(self, prefix: str) -> list[T]:
         """Get all components in namespaces matching prefix.
 
@@ -201,6 +235,17 @@ class ComponentRegistry[T: Component]:
         """
         return self._storage.all_items()
 
+    def iter_components(self) -> Iterator[T]:
+        """Iterate over registered components without building a list.
+
+        Prefer this over all_components() for scans (counting, any(),
+        streaming), which then need O(1) extra memory.
+
+        Returns:
+            Iterator over all components
+        """
+        return self._storage.iter_items()
+
     def defer_resolution(self, qname: QName, callback: Callable[[T], None]) -> bool:
         """Register callback for deferred resolution.
 
@@ -221,9 +266,8 @@ class ComponentRegistry[T: Component]:
             return True
 
         # Defer callback
-        if qname not in self._callbacks:
-            self._callbacks[qname] = []
         self._callbacks[qname].append(callback)
+        self._stats_dirty = True
         return False
 
     def _process_callbacks(self, qname: QName, component: T) -> None:
@@ -233,9 +277,13 @@ class ComponentRegistry[T: Component]:
             qname: QName that was just registered
             component: Component that was registered
         """
-        callbacks = self._callbacks.pop(qname, [])
-        for callback in callbacks:
-            callback(component)
+        # Common case: nothing is waiting on any QName
+        if not self._callbacks:
+            return
+        callbacks = self._callbacks.pop(qname, None)
+        if callbacks:
+            for callback in callbacks:
+                callback(component)
 
     def pending_qnames(self) -> list[QName]:
         """Get QNames with pending callbacks.
@@ -248,26 +296,38 @@ class ComponentRegistry[T: Component]:
     def stats(self) -> RegistryStats:
         """Get registry statistics.
 
+        The snapshot is cached until the registry is mutated. Direct writes
+        through ``storage`` are caught by a component count check.
+
         Returns:
             RegistryStats dataclass with metrics
         """
+        cached = self._cached_stats
+        if cached is not None and not self._stats_dirty and self._stats_len == len(self._storage):
+            return cached
+
         storage_stats = self._storage.stats()
         pending = sum(len(cbs) for cbs in self._callbacks.values())
 
         # Get Bloom stats if available (TrieStorage)
         bloom_bytes = 0
         bloom_fp = 0.0
-        if isinstance(self._storage, TrieStorage):
-            bloom_bytes = self._storage.bloom_memory_bytes
-            bloom_fp = self._storage.bloom_false_positive_rate
+        if self._is_trie:
+            trie = cast("TrieStorage[T]", self._storage)
+            bloom_bytes = trie.bloom_memory_bytes
+            bloom_fp = trie.bloom_false_positive_rate
 
-        return RegistryStats(
+        stats = RegistryStats(
             total_components=storage_stats.total_items,
             namespaces=storage_stats.namespaces,
             bloom_size_bytes=bloom_bytes,
             bloom_false_positive_rate=bloom_fp,
             pending_callbacks=pending,
         )
+        self._cached_stats = stats
+        self._stats_len = storage_stats.total_items
+        self._stats_dirty = False
+        return stats
 
     def clear(self) -> None:
         """Clear all registered components.
@@ -276,6 +336,7 @@ class ComponentRegistry[T: Component]:
         """
         self._storage.clear()
         self._callbacks.clear()
+        self._stats_dirty = True
 
     @property
     def storage(self) -> StorageStrategy[T]:
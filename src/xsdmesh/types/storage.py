@@ -24,8 +24,12 @@ from typing import Protocol, runtime_checkable
 from xsdmesh.types.base import Component
 from xsdmesh.types.qname import QName
 from xsdmesh.utils.bloom import BloomFilter
+from xsdmesh.utils.cache import FIFOCache
 from xsdmesh.utils.trie import PatriciaTrie
 
+# Max cached by_namespace_prefix results per DictStorage
+_PREFIX_CACHE_SIZE = 256
+
 
 @dataclass(frozen=True)
 class StorageStats:
@@ -140,6 +144,30 @@ class StorageStrategy[T: Component](Protocol):
         """
         ...
 
+    @abstractmethod
+    def iter_items(self) -> Iterator[T]:
+        """Iterate over all stored components without building a list.
+
+        Returns:
+            Iterator over all components, in all_items order
+        """
+        ...
+
+    @abstractmethod
+    def iter_namespace(self, namespace: str) -> Iterator[T]:
+        """Iterate over components in exact namespace without building a list.
+
+        Like iter_items, the iterator reads live storage: do not store or
+        remove components while consuming it.
+
+        Args:
+            namespace: Namespace URI
+
+        Returns:
+            Iterator over the components by_namespace would return
+        """
+        ...
+
     @abstractmethod
     def clear(self) -> None:
         """Remove all stored components."""
@@ -167,7 +195,13 @@ class DictStorage[T: Component]:
     def __init__(self) -> None:
         """Initialize empty storage."""
         self._items: dict[QName, T] = {}
-        self._namespace_index: dict[str, list[T]] = {}
+        # namespace -> local_name -> component (O(1) removal)
+        self._namespace_index: dict[str, dict[str, T]] = {}
+
+        # Bumped by every mutation; prefix results carry the version they
+        # were computed at and are stale once it moves on
+        self._version = 0
+        self._prefix_cache: FIFOCache[str, tuple[int, list[T]]] = FIFOCache(_PREFIX_CACHE_SIZE)
 
     def store(self, qname: QName, component: T) -> None:
         """Store component by QName."""
@@ -176,12 +210,10 @@ class DictStorage[T: Component]:
             raise ValueError(msg)
 
         self._items[qname] = component
+        self._version += 1
 
         # Update namespace index
-        ns = qname.namespace
-        if ns not in self._namespace_index:
-            self._namespace_index[ns] = []
-        self._namespace_index[ns].append(component)
+        self._namespace_index.setdefault(qname.namespace, {})[qname.local_name] = component
 
     def lookup(self, qname: QName) -> T | None:
         """Look up component by QName."""
@@ -192,12 +224,14 @@ class DictStorage[T: Component]:
         component = self._items.pop(qname, None)
         if component is None:
             return False
+        self._version += 1
 
         # Update namespace index
         ns = qname.namespace
-        if ns in self._namespace_index:
-            self._namespace_index[ns] = [c for c in self._namespace_index[ns] if c.qname != qname]
-            if not self._namespace_index[ns]:
+        bucket = self._namespace_index.get(ns)
+        if bucket is not None:
+            bucket.pop(qname.local_name, None)
+            if not bucket:
                 del self._namespace_index[ns]
         return True
 
@@ -215,15 +249,26 @@ class DictStorage[T: Component]:
 
     def by_namespace(self, namespace: str) -> list[T]:
         """Get components in namespace."""
-        return list(self._namespace_index.get(namespace, []))
+        bucket = self._namespace_index.get(namespace)
+        return list(bucket.values()) if bucket is not None else []
 
     def by_namespace_prefix(self, prefix: str) -> list[T]:
-        """Get components in namespaces matching prefix (O(n) scan)."""
+        """Get components in namespaces matching prefix.
+
+        O(n) scan over namespaces, memoized per prefix until the next
+        mutation; callers get a copy of the cached result.
+        """
+        entry = self._prefix_cache.get(prefix)
+        if entry is not None and entry[0] == self._version:
+            return list(entry[1])
+
         result: list[T] = []
-        for ns, components in self._namespace_index.items():
+        for ns, bucket in self._namespace_index.items():
             if ns.startswith(prefix):
-                result.extend(components)
-        return result
+                result.extend(bucket.values())
+
+        self._prefix_cache[prefix] = (self._version, result)
+        return list(result)
 
     def namespaces(self) -> list[str]:
         """Get all namespaces."""
@@ -233,10 +278,20 @@ class DictStorage[T: Component]:
         """Get all components."""
         return list(self._items.values())
 
+    def iter_items(self) -> Iterator[T]:
+        """Iterate over all components."""
+        return iter(self._items.values())
+
+    def iter_namespace(self, namespace: str) -> Iterator[T]:
+        """Iterate over components in namespace."""
+        return iter(self._namespace_index.get(namespace, {}).values())
+
     def clear(self) -> None:
         """Clear all components."""
         self._items.clear()
         self._namespace_index.clear()
+        self._prefix_cache.clear()
+        self._version += 1
 
     def stats(self) -> StorageStats:
         """Get storage statistics."""
@@ -285,6 +340,10 @@ class TrieStorage[T: Component]:
         # Trie: namespace -> dict of local_name -> component
         self._trie: PatriciaTrie[dict[str, T]] = PatriciaTrie()
 
+        # Non-empty namespaces -> the same dicts, in insertion order; full
+        # scans use this instead of walking the trie
+        self._namespaces: dict[str, dict[str, T]] = {}
+
         # Bloom filter for fast negative lookups
         self._bloom = BloomFilter(
             expected_elements=expected_items,
@@ -300,10 +359,14 @@ class TrieStorage[T: Component]:
         local = qname.local_name
 
         # Get or create namespace dict in trie
-        ns_dict = self._trie.get(ns)
+        ns_dict = self._namespaces.get(ns)
         if ns_dict is None:
-            ns_dict = {}
-            self._trie[ns] = ns_dict
+            # May be a dict emptied by remove (the trie keeps its keys)
+            ns_dict = self._trie.get(ns)
+            if ns_dict is None:
+                ns_dict = {}
+                self._trie[ns] = ns_dict
+            self._namespaces[ns] = ns_dict
 
         # Check for duplicate
         if local in ns_dict:
@@ -312,13 +375,13 @@ class TrieStorage[T: Component]:
 
         # Store component
         ns_dict[local] = component
-        self._bloom.add(qname.expanded)
+        self._bloom.add_bytes(qname.expanded_bytes)
         self._count += 1
 
     def lookup(self, qname: QName) -> T | None:
         """Look up component using Bloom + Trie."""
         # Fast negative via Bloom
-        if qname.expanded not in self._bloom:
+        if not self._bloom.contains_bytes(qname.expanded_bytes):
             return None
 
         # Trie lookup
@@ -339,6 +402,8 @@ class TrieStorage[T: Component]:
 
         del ns_dict[qname.local_name]
         self._count -= 1
+        if not ns_dict:
+            self._namespaces.pop(qname.namespace, None)
 
         # Note: Bloom filter doesn't support removal (false positives acceptable)
         # Note: Empty ns_dict left in trie (Patricia Trie doesn't support delete)
@@ -347,7 +412,7 @@ class TrieStorage[T: Component]:
     def __contains__(self, qname: QName) -> bool:
         """Check if QName exists."""
         # Fast negative via Bloom
-        if qname.expanded not in self._bloom:
+        if not self._bloom.contains_bytes(qname.expanded_bytes):
             return False
 
         ns_dict = self._trie.get(qname.namespace)
@@ -362,11 +427,9 @@ class TrieStorage[T: Component]:
 
     def __iter__(self) -> Iterator[QName]:
         """Iterate over all QNames."""
-        for ns in self._trie.keys_with_prefix(""):
-            ns_dict = self._trie.get(ns)
-            if ns_dict:
-                for local in ns_dict:
-                    yield QName(ns, local)
+        for ns, ns_dict in self._namespaces.items():
+            for local in ns_dict:
+                yield QName(ns, local)
 
     def by_namespace(self, namespace: str) -> list[T]:
         """Get all components in namespace (O(k) trie lookup)."""
@@ -389,32 +452,37 @@ class TrieStorage[T: Component]:
         return result
 
     def namespaces(self) -> list[str]:
-        """Get all namespaces."""
-        return self._trie.keys_with_prefix("")
+        """Get all namespaces (those with at least one component)."""
+        return list(self._namespaces)
 
     def all_items(self) -> list[T]:
         """Get all components."""
-        result: list[T] = []
-        for ns in self._trie.keys_with_prefix(""):
-            ns_dict = self._trie.get(ns)
-            if ns_dict:
-                result.extend(ns_dict.values())
-        return result
+        return list(self.iter_items())
+
+    def iter_items(self) -> Iterator[T]:
+        """Iterate over all components, namespace by namespace."""
+        for ns_dict in self._namespaces.values():
+            yield from ns_dict.values()
+
+    def iter_namespace(self, namespace: str) -> Iterator[T]:
+        """Iterate over components in namespace (O(1) bucket lookup)."""
+        return iter(self._namespaces.get(namespace, {}).values())
 
     def clear(self) -> None:
         """Clear all components."""
         self._trie = PatriciaTrie()
+        self._namespaces.clear()
         self._bloom.clear()
         self._count = 0
 
     def stats(self) -> StorageStats:
         """Get storage statistics."""
-        namespaces = self._trie.keys_with_prefix("")
+        namespaces = len(self._namespaces)
         # Rough estimate: trie nodes + bloom + dict overhead
-        memory = self._bloom.memory_bytes + len(namespaces) * 200 + self._count * 64
+        memory = self._bloom.memory_bytes + namespaces * 200 + self._count * 64
         return StorageStats(
             total_items=self._count,
-            namespaces=len(namespaces),
+            namespaces=namespaces,
             memory_estimate_bytes=memory,
         )
 
@@ -432,7 +500,7 @@ class TrieStorage[T: Component]:
         """Debug representation."""
         return (
             f"TrieStorage(items={self._count}, "
-            f"namespaces={len(self._trie)}, "
+            f"namespaces={len(self._namespaces)}, "
             f"bloom_bytes={self._bloom.memory_bytes})"
         )
 
@@ -4,7 +4,7 @@ Provides logging, profiling, debugging, and data structure utilities.
 """
 
 from xsdmesh.utils.bloom import BloomFilter
-from xsdmesh.utils.cache import ARCCache
+from xsdmesh.utils.cache import ARCCache, FIFOCache, SchemaCache
 from xsdmesh.utils.debug import format_ast, format_qname, pprint_component, truncate
 from xsdmesh.utils.logger import (
     LogContext,
@@ -42,4 +42,7 @@ __all__ = [
     "BloomFilter",
     "PatriciaTrie",
     "ARCCache",
+    "FIFOCache",
+    # Caching
+    "SchemaCache",
 ]
@@ -10,6 +10,11 @@ import hashlib
 import math
 from collections.abc import Hashable
 
+_MASK64 = (1 << 64) - 1
+
+# Single-bit mask for each bit position in a byte
+_BIT_MASKS = tuple(1 << i for i in range(8))
+
 
 class BloomFilter:
     """Space-efficient probabilistic set for membership testing.
@@ -37,7 +42,7 @@ class BloomFilter:
         # Optimal hash functions: k = (m/n) * ln(2)
         self.num_hashes = self._optimal_num_hashes(self.size, expected_elements)
 
-        # Bit array
+        # Bit array: bit i lives in byte i >> 3 at position i & 7
         self.bits = bytearray((self.size + 7) // 8)  # Round up to bytes
 
         self.count = 0
@@ -70,6 +75,24 @@ class BloomFilter:
             return 1
         return max(1, int((m / n) * math.log(2)))
 
+    @staticmethod
+    def _base_hashes(data: bytes) -> tuple[int, int]:
+        """Derive the two double-hashing bases from one 128-bit digest.
+
+        A single BLAKE2b call (no cryptographic strength is needed) gives
+        h1 as the low and h2 as the high 64 bits. Unlike hash(), the
+        digest does not change between processes, so bit positions stay
+        valid for pickled filters.
+
+        Args:
+            data: Serialized item
+
+        Returns:
+            (h1, h2)
+        """
+        h = int.from_bytes(hashlib.blake2b(data, digest_size=16).digest(), "little")
+        return h & _MASK64, h >> 64
+
     def _hashes(self, item: Hashable) -> list[int]:
         """Generate k hash values for item.
 
@@ -81,15 +104,9 @@ class BloomFilter:
         Returns:
             List of k hash values
         """
-        # Serialize item
-        data = str(item).encode("utf-8")
-
-        # Two base hashes
-        h1 = int(hashlib.md5(data, usedforsecurity=False).hexdigest(), 16)
-        h2 = int(hashlib.sha1(data, usedforsecurity=False).hexdigest(), 16)
-
-        # Generate k hashes using double hashing
-        return [(h1 + i * h2) % self.size for i in range(self.num_hashes)]
+        h1, h2 = self._base_hashes(str(item).encode("utf-8"))
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.num_hashes)]
 
     def add(self, item: Hashable) -> None:
         """Add item to filter.
@@ -97,10 +114,26 @@ class BloomFilter:
         Args:
             item: Item to add
         """
-        for hash_val in self._hashes(item):
-            byte_idx = hash_val // 8
-            bit_idx = hash_val % 8
-            self.bits[byte_idx] |= 1 << bit_idx
+        self.add_bytes(str(item).encode("utf-8"))
+
+    def add_bytes(self, data: bytes) -> None:
+        """Add an already serialized item (UTF-8 of str(item), as add).
+
+        Args:
+            data: Item bytes
+        """
+        h1, h2 = self._base_hashes(data)
+        size = self.size
+        bits = self.bits
+        masks = _BIT_MASKS
+        # Same positions as _hashes, stepped incrementally (see contains_bytes)
+        pos = h1 % size
+        step = h2 % size
+        for _ in range(self.num_hashes):
+            bits[pos >> 3] |= masks[pos & 7]
+            pos += step
+            if pos >= size:
+                pos -= size
 
         self.count += 1
 
@@ -111,11 +144,34 @@ class BloomFilter:
             True: item MIGHT be present (with FP rate)
             False: item DEFINITELY not present
         """
-        for hash_val in self._hashes(item):
-            byte_idx = hash_val // 8
-            bit_idx = hash_val % 8
-            if not (self.bits[byte_idx] & (1 << bit_idx)):
+        return self.contains_bytes(str(item).encode("utf-8"))
+
+    def contains_bytes(self, data: bytes) -> bool:
+        """Check an already serialized item (UTF-8 of str(item), as add).
+
+        Probe positions are generated one at a time, so a miss stops at
+        the first clear bit. With h1 and h2 reduced mod m once, each next
+        position is one small-int add and wrap instead of a multiply and
+        modulo on 64-bit values; (h1 + i*h2) % m yields the same sequence.
+
+        Args:
+            data: Item bytes
+
+        Returns:
+            True if the item might be present, False if it is not
+        """
+        h1, h2 = self._base_hashes(data)
+        size = self.size
+        bits = self.bits
+        masks = _BIT_MASKS
+        pos = h1 % size
+        step = h2 % size
+        for _ in range(self.num_hashes):
+            if not bits[pos >> 3] & masks[pos & 7]:
                 return False
+            pos += step
+            if pos >= size:
+                pos -= size
         return True
 
     def clear(self) -> None:
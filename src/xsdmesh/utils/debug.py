@@ -5,14 +5,22 @@ Provides utilities to format and display XSD component trees.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import fields, is_dataclass
+from io import StringIO
 from typing import Any
 
+# Formatter signature: (buf, obj, indent, max_depth) -> None, writes to buf
+_Formatter = Callable[[StringIO, Any, int, int], None]
+
 
 def format_ast(obj: Any, *, indent: int = 0, max_depth: int = 10) -> str:
     """Format AST node as indented tree.
 
     Recursively formats dataclass instances with nested structure.
+    Dispatch is one dict lookup on the exact type; other types are
+    classified once by _formatter_for and then cached. All levels write
+    into one buffer, so output is built in a single pass.
 
     Args:
         obj: Object to format (typically dataclass)
@@ -22,65 +30,134 @@ def format_ast(obj: Any, *, indent: int = 0, max_depth: int = 10) -> str:
     Returns:
         Formatted string representation
     """
+    buf = StringIO()
+    _format_ast(buf, obj, indent, max_depth)
+    return buf.getvalue()
+
+
+def _format_ast(buf: StringIO, obj: Any, indent: int, max_depth: int) -> None:
+    """Write obj formatted at indent into buf (see format_ast)."""
     if max_depth <= 0:
-        return "..."
+        buf.write("...")
+        return
+
+    formatter = _FORMATTERS.get(type(obj))
+    if formatter is None:
+        formatter = _formatter_for(type(obj))
+    formatter(buf, obj, indent, max_depth)
+
+
+def _format_none(buf: StringIO, obj: None, indent: int, max_depth: int) -> None:
+    """Format None."""
+    buf.write("None")
 
-    prefix = "  " * indent
 
-    # Handle None
-    if obj is None:
-        return "None"
-
-    # Handle primitives
-    if isinstance(obj, (str, int, float, bool)):
-        return repr(obj)
-
-    # Handle lists
-    if isinstance(obj, list):
-        if not obj:
-            return "[]"
-        items = [
-            f"{prefix}  - {format_ast(item, indent=indent + 1, max_depth=max_depth - 1)}"
-            for item in obj
-        ]
-        return "[\n" + "\n".join(items) + f"\n{prefix}]"
-
-    # Handle dicts
-    if isinstance(obj, dict):
-        if not obj:
-            return "{}"
-        items = [
-            f"{prefix}  {k}: {format_ast(v, indent=indent + 1, max_depth=max_depth - 1)}"
-            for k, v in obj.items()
-        ]
-        return "{\n" + "\n".join(items) + f"\n{prefix}" + "}"
-
-    # Handle sets
-    if isinstance(obj, (set, frozenset)):
-        if not obj:
-            return "{}"
-        return "{" + ", ".join(repr(x) for x in sorted(obj, key=str)) + "}"
-
-    # Handle dataclasses
-    if is_dataclass(obj):
-        class_name = obj.__class__.__name__
-        field_strs = []
-        for field in fields(obj):
-            value = getattr(obj, field.name)
-            # Skip None and empty collections for brevity
-            if value is None:
-                continue
-            if isinstance(value, (list, dict, set, frozenset)) and not value:
-                continue
-            formatted = format_ast(value, indent=indent + 1, max_depth=max_depth - 1)
-            field_strs.append(f"{prefix}  {field.name}={formatted}")
-
-        if not field_strs:
-            return f"{class_name}()"
-        return f"{class_name}(\n" + ",\n".join(field_strs) + f"\n{prefix})"
-
-    # Fallback to repr
-    return repr(obj)
+def _format_repr(buf: StringIO, obj: Any, indent: int, max_depth: int) -> None:
+    """Format primitives (and unknown types) by repr."""
+    buf.write(repr(obj))
+
+
+def _format_list(buf: StringIO, obj: list[Any], indent: int, max_depth: int) -> None:
+    """Format list as one "- item" line per element."""
+    if not obj:
+        buf.write("[]")
+        return
+    prefix = "  " * indent
+    item_prefix = f"{prefix}  - "
+    buf.write("[\n")
+    for item in obj:
+        buf.write(item_prefix)
+        _format_ast(buf, item, indent + 1, max_depth - 1)
+        buf.write("\n")
+    buf.write(prefix)
+    buf.write("]")
+
+
+def _format_dict(buf: StringIO, obj: dict[Any, Any], indent: int, max_depth: int) -> None:
+    """Format dict as one "key: value" line per entry."""
+    if not obj:
+        buf.write("{}")
+        return
+    prefix = "  " * indent
+    buf.write("{\n")
+    for k, v in obj.items():
+        buf.write(f"{prefix}  {k}: ")
+        _format_ast(buf, v, indent + 1, max_depth - 1)
+        buf.write("\n")
+    buf.write(prefix)
+    buf.write("}")
+
+
+def _format_set(buf: StringIO, obj: set[Any] | frozenset[Any], indent: int, max_depth: int) -> None:
+    """Format set inline, sorted by str for stable output."""
+    if not obj:
+        buf.write("{}")
+        return
+    buf.write("{" + ", ".join(repr(x) for x in sorted(obj, key=str)) + "}")
+
+
+def _format_dataclass(buf: StringIO, obj: Any, indent: int, max_depth: int) -> None:
+    """Format dataclass fields, skipping None and empty collections."""
+    class_name = obj.__class__.__name__
+    shown = []
+    for field in fields(obj):
+        value = getattr(obj, field.name)
+        # Skip None and empty collections for brevity
+        if value is None:
+            continue
+        if isinstance(value, (list, dict, set, frozenset)) and not value:
+            continue
+        shown.append((field.name, value))
+
+    if not shown:
+        buf.write(f"{class_name}()")
+        return
+    prefix = "  " * indent
+    buf.write(f"{class_name}(\n")
+    for i, (name, value) in enumerate(shown):
+        if i:
+            buf.write(",\n")
+        buf.write(f"{prefix}  {name}=")
+        _format_ast(buf, value, indent + 1, max_depth - 1)
+    buf.write(f"\n{prefix})")
+
+
+# Exact type -> formatter; extended by _formatter_for as new types are seen
+_FORMATTERS: dict[type, _Formatter] = {
+    type(None): _format_none,
+    str: _format_repr,
+    int: _format_repr,
+    float: _format_repr,
+    bool: _format_repr,
+    list: _format_list,
+    dict: _format_dict,
+    set: _format_set,
+    frozenset: _format_set,
+}
+
+
+def _formatter_for(cls: type) -> _Formatter:
+    """Classify a type not yet in _FORMATTERS and cache the result.
+
+    Subclasses format like their base (checked in the original order:
+    primitives, list, dict, set); dataclasses get field formatting;
+    anything else falls back to repr.
+    """
+    formatter: _Formatter
+    if issubclass(cls, (str, int, float, bool)):
+        formatter = _format_repr
+    elif issubclass(cls, list):
+        formatter = _format_list
+    elif issubclass(cls, dict):
+        formatter = _format_dict
+    elif issubclass(cls, (set, frozenset)):
+        formatter = _format_set
+    elif is_dataclass(cls):
+        formatter = _format_dataclass
+    else:
+        formatter = _format_repr
+    _FORMATTERS[cls] = formatter
+    return formatter
 
 
 def pprint_component(component: Any, *, max_depth: int = 5) -> None:
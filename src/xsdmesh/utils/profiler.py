@@ -2,11 +2,15 @@
 
 Provides time and memory profiling decorators for performance monitoring.
 Uses tracemalloc for memory tracking and perf_counter for timing.
+
+Timing is only active when the XSDMESH_PROFILE environment variable is set
+at import time; otherwise profile_time returns the function unchanged.
 """
 
 from __future__ import annotations
 
 import functools
+import os
 import time
 import tracemalloc
 from collections.abc import Callable
@@ -16,18 +20,24 @@ from xsdmesh.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Read once at import: decorators are applied at definition time
+_PROFILING_ENABLED = bool(os.environ.get("XSDMESH_PROFILE"))
+
 
 def profile_time[**P, R](func: Callable[P, R]) -> Callable[P, R]:
     """Decorator to measure function execution time.
 
-    Logs duration in milliseconds. Warns if >1s.
+    Logs duration in milliseconds. Warns if >1s. Without XSDMESH_PROFILE
+    set at import time this is an identity decorator (no wrapper frame).
 
     Args:
         func: Function to profile
 
     Returns:
-        Wrapped function with timing
+        Wrapped function with timing, or func itself when profiling is off
     """
+    if not _PROFILING_ENABLED:
+        return func
 
     @functools.wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pickle
+
 import pytest
 
 from xsdmesh.constants import XSD_NAMESPACE
@@ -39,6 +41,17 @@ class TestParseContextInit:
         assert ctx.resolve_prefix("xsd") == XSD_NAMESPACE
         assert ctx.resolve_prefix("xml") == "http://www.w3.org/XML/1998/namespace"
 
+    def test_slots_and_pickle(self) -> None:
+        """Test context has no instance dict and survives pickling."""
+        ctx = ParseContext(target_namespace="http://example.com")
+        ctx.push_namespace_scope({"tns": "http://example.com"})
+        ctx.push_element(XSD_NAMESPACE, "schema")
+
+        assert not hasattr(ctx, "__dict__")
+        restored = pickle.loads(pickle.dumps(ctx))
+        assert restored.resolve_prefix("tns") == "http://example.com"
+        assert restored.get_path_str() == ctx.get_path_str()
+
 
 class TestNamespaceStack:
     """Test namespace stack operations."""
@@ -62,6 +75,17 @@ class TestNamespaceStack:
         ctx.push_namespace_scope()
         assert len(ctx.namespace_stack) == initial_depth + 1
 
+    def test_push_namespace_into_empty_scope(self) -> None:
+        """Test push_namespace after an empty scope leaves other scopes clean."""
+        ctx = ParseContext()
+        ctx.push_namespace_scope()
+        ctx.push_namespace("tns", "http://example.com")
+        assert ctx.resolve_prefix("tns") == "http://example.com"
+
+        other = ParseContext()
+        other.push_namespace_scope()
+        assert other.resolve_prefix("tns") is None
+
     def test_pop_namespace_scope(self) -> None:
         """Test popping namespace scope."""
         ctx = ParseContext()
@@ -95,6 +119,19 @@ class TestNamespaceStack:
         assert ctx.resolve_prefix("a") == "http://a.com"
         assert ctx.resolve_prefix("b") is None
 
+    def test_shadowed_prefix_restored_on_pop(self) -> None:
+        """Test inner rebinding shadows outer one until its scope is popped."""
+        ctx = ParseContext()
+        ctx.push_namespace_scope({"a": "http://outer.com"})
+        ctx.push_namespace_scope({"a": "http://inner.com"})
+        ctx.push_namespace("a", "http://rebound.com")
+        assert ctx.resolve_prefix("a") == "http://rebound.com"
+
+        ctx.pop_namespace_scope()
+        assert ctx.resolve_prefix("a") == "http://outer.com"
+        ctx.pop_namespace_scope()
+        assert ctx.resolve_prefix("a") is None
+
 
 class TestElementPath:
     """Test element path tracking."""
@@ -153,6 +190,17 @@ class TestElementPath:
         ctx.push_element("", "root")
         assert ctx.get_path_str() == "/root"
 
+    def test_get_path_str_tracks_push_pop(self) -> None:
+        """Test cached path string is refreshed after push/pop."""
+        ctx = ParseContext()
+        ctx.push_element("", "root")
+        assert ctx.get_path_str() == "/root"
+        ctx.push_element("", "child")
+        assert ctx.get_path_str() == "/root/child"
+        assert ctx.pop_element() == ("", "child")
+        assert ctx.get_path_str() == "/root"
+        assert ctx.current_path == [("", "root")]
+
 
 class TestQNameResolution:
     """Test QName resolution."""
@@ -197,6 +245,49 @@ class TestQNameResolution:
         assert exc_info.value.file_path == "test.xsd"
         assert exc_info.value.element == "{http://example.com}root"
 
+    def test_resolve_qname_memoized(self) -> None:
+        """Test repeated resolution under same bindings returns cached QName."""
+        ctx = ParseContext()
+        ctx.push_namespace_scope({"tns": "http://example.com"})
+        first = ctx.resolve_qname("tns:local")
+        ctx.push_namespace_scope()  # Empty scope: bindings unchanged
+        assert ctx.resolve_qname("tns:local") is first
+
+    def test_resolve_qname_cache_follows_scope_changes(self) -> None:
+        """Test rebinding a prefix invalidates memoized resolutions."""
+        ctx = ParseContext()
+        ctx.push_namespace_scope({"tns": "http://a.com"})
+        assert ctx.resolve_qname("tns:x").namespace == "http://a.com"
+
+        ctx.push_namespace_scope({"tns": "http://b.com"})
+        assert ctx.resolve_qname("tns:x").namespace == "http://b.com"
+
+        ctx.pop_namespace_scope()
+        assert ctx.resolve_qname("tns:x").namespace == "http://a.com"
+
+        ctx.push_namespace("tns", "http://c.com")
+        assert ctx.resolve_qname("tns:x").namespace == "http://c.com"
+
+    def test_resolve_qnames_matches_single_resolution(self) -> None:
+        """Test bulk resolution agrees with resolve_qname for every form."""
+        texts = ["xs:string", "local", " xs:int ", "{http://c.com}clark"]
+        bulk_ctx = ParseContext(target_namespace="http://tns.com")
+        bulk_ctx.push_namespace_scope({"xs": "http://www.w3.org/2001/XMLSchema"})
+        ctx = ParseContext(target_namespace="http://tns.com")
+        ctx.push_namespace_scope({"xs": "http://www.w3.org/2001/XMLSchema"})
+
+        result = bulk_ctx.resolve_qnames(texts)
+
+        assert result == [ctx.resolve_qname(text) for text in texts]
+        assert result[0] == QName("http://www.w3.org/2001/XMLSchema", "string")
+        assert result[1] == QName("http://tns.com", "local")
+
+    def test_resolve_qnames_undefined_prefix_error(self) -> None:
+        """Test bulk resolution raises ParseError for undefined prefix."""
+        ctx = ParseContext()
+        with pytest.raises(ParseError, match="Undefined namespace prefix"):
+            ctx.resolve_qnames(["local", "missing:foo"])
+
 
 class TestErrorHandling:
     """Test error accumulation."""
@@ -231,6 +322,17 @@ class TestErrorHandling:
 
         assert len(ctx.errors) == 3
 
+    def test_errors_capped_at_max_errors(self) -> None:
+        """Test errors beyond max_errors are counted but not recorded."""
+        ctx = ParseContext(max_errors=2)
+        for i in range(5):
+            ctx.add_error(f"Error {i}")
+
+        assert [e.message for e in ctx.errors] == ["Error 0", "Error 1"]
+        assert ctx.suppressed_errors == 3
+        assert "suppressed_errors=3" in repr(ctx)
+        assert ctx.clone().max_errors == 2
+
 
 class TestContextClone:
     """Test context cloning."""
@@ -272,6 +374,21 @@ class TestContextClone:
         assert ctx.resolve_prefix("other") is None
         assert clone.resolve_prefix("other") == "http://other.com"
 
+    def test_clone_shares_scopes_copy_on_write(self) -> None:
+        """Test cloned scopes are shared until mutated by either side."""
+        ctx = ParseContext()
+        ctx.push_namespace_scope({"tns": "http://example.com"})
+
+        clone = ctx.clone()
+        assert clone.namespace_stack[-1] is ctx.namespace_stack[-1]
+
+        clone.push_namespace("tns", "http://changed.com")
+        assert clone.resolve_prefix("tns") == "http://changed.com"
+        assert ctx.resolve_prefix("tns") == "http://example.com"
+
+        ctx.push_namespace("extra", "http://extra.com")
+        assert clone.resolve_prefix("extra") is None
+
     def test_clone_errors_not_copied(self) -> None:
         """Test errors are not copied to clone."""
         ctx = ParseContext()
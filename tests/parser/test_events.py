@@ -2,22 +2,24 @@
 
 from __future__ import annotations
 
+from lxml import etree
+
 from xsdmesh.parser.events import Event, EventBuffer, EventType
 
 
 class TestEventType:
-    """Test EventType enum."""
+    """Test EventType constants."""
 
     def test_event_types_exist(self) -> None:
         """Test all event types exist."""
-        assert EventType.START_ELEMENT.value == "start"
-        assert EventType.END_ELEMENT.value == "end"
-        assert EventType.TEXT.value == "text"
-        assert EventType.COMMENT.value == "comment"
+        assert EventType.START_ELEMENT == "start"
+        assert EventType.END_ELEMENT == "end"
+        assert EventType.TEXT == "text"
+        assert EventType.COMMENT == "comment"
 
 
 class TestEvent:
-    """Test Event NamedTuple."""
+    """Test Event dataclass."""
 
     def test_event_creation(self) -> None:
         """Test Event creation."""
@@ -45,6 +47,12 @@ class TestEvent:
         )
         assert event.text == "Hello"
 
+    def test_event_uses_slots(self) -> None:
+        """Test Event has no per-instance __dict__."""
+        event = Event(EventType.START_ELEMENT, None, None, 1, 0)
+        assert not hasattr(event, "__dict__")
+        assert event == Event(EventType.START_ELEMENT, None, None, 1, 0)
+
 
 class TestEventBuffer:
     """Test EventBuffer."""
@@ -212,3 +220,86 @@ class TestEventBuffer:
 
         buffer.push(event2)
         assert len(buffer) == 2
+
+    def test_push_event_fields(self) -> None:
+        """Test push_event() stores fields and materializes Event on access."""
+        buffer = EventBuffer()
+        buffer.push_event(EventType.TEXT, None, "hello", 7, 3)
+
+        assert buffer.lookahead(1) == Event(EventType.TEXT, None, "hello", 7, 3)
+        assert buffer.consume() == Event(EventType.TEXT, None, "hello", 7, 3)
+        assert len(buffer) == 0
+
+    def test_push_event_line_from_element(self) -> None:
+        """Test omitted line is read from element.sourceline on access."""
+        root = etree.fromstring(b"<root>\n<child/></root>")
+        buffer = EventBuffer()
+        buffer.push_event(EventType.START_ELEMENT, root[0])
+        buffer.push_event(EventType.TEXT, None, "x")
+
+        first = buffer.consume()
+        second = buffer.consume()
+        assert first is not None and first.line == 2
+        assert second is not None and second.line == 0
+
+    def test_record_overwrites_slot_fields(self) -> None:
+        """Test record() resets text/column left by earlier events in the slot."""
+        root = etree.fromstring(b"<root/>")
+        buffer = EventBuffer(maxlen=1)
+        buffer.push_event(EventType.TEXT, None, "stale", 5, 9)
+        buffer.record(EventType.END_ELEMENT, root)
+
+        assert buffer.consume() == Event(EventType.END_ELEMENT, root, None, 1, 0)
+        assert len(buffer) == 0
+
+    def test_ring_wraps_after_consume(self) -> None:
+        """Test ring indices wrap around while interleaving push/consume."""
+        buffer = EventBuffer(maxlen=2)
+        for line in range(1, 6):
+            buffer.push_event(EventType.START_ELEMENT, None, None, line, 0)
+            consumed = buffer.consume()
+            assert consumed is not None
+            assert consumed.line == line
+
+        buffer.push_event(EventType.START_ELEMENT, None, None, 10, 0)
+        buffer.push_event(EventType.START_ELEMENT, None, None, 11, 0)
+        buffer.push_event(EventType.START_ELEMENT, None, None, 12, 0)  # Drops 10
+        assert [e.line for e in (buffer.lookahead(1), buffer.lookahead(2)) if e] == [11, 12]
+
+    def test_push_many_keeps_last_maxlen(self) -> None:
+        """Test push_many() matches pushing each event in order."""
+        buffer = EventBuffer(maxlen=2)
+        buffer.push_many(Event(EventType.START_ELEMENT, None, None, line, 0) for line in range(5))
+
+        assert len(buffer) == 2
+        assert [e.line for e in buffer.consume_while(lambda e: True)] == [3, 4]
+
+    def test_consume_while(self) -> None:
+        """Test consume_while() stops at the first non-matching event."""
+        buffer = EventBuffer()
+        buffer.push_event(EventType.TEXT, None, "a", 1, 0)
+        buffer.push_event(EventType.TEXT, None, "b", 2, 0)
+        buffer.push_event(EventType.START_ELEMENT, None, None, 3, 0)
+
+        consumed = buffer.consume_while(lambda e: e.type == EventType.TEXT)
+
+        assert [e.text for e in consumed] == ["a", "b"]
+        assert buffer.current == consumed[-1]
+        assert len(buffer) == 1
+
+    def test_skip_whitespace_text(self) -> None:
+        """Test skip_whitespace_text() drops only blank leading text events."""
+        buffer = EventBuffer()
+        buffer.push_event(EventType.TEXT, None, "  \n", 1, 0)
+        buffer.push_event(EventType.TEXT, None, "", 2, 0)
+        buffer.push_event(EventType.TEXT, None, " x ", 3, 0)
+
+        assert buffer.skip_whitespace_text() == 2
+        next_event = buffer.lookahead(1)
+        assert next_event is not None
+        assert next_event.text == " x "
+        assert buffer.skip_whitespace_text() == 0
+
+    def test_buffer_has_no_instance_dict(self) -> None:
+        """Test EventBuffer uses __slots__."""
+        assert not hasattr(EventBuffer(), "__dict__")
@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 from io import BytesIO
+from pathlib import Path
 
 import pytest
 
-from xsdmesh.exceptions import ParseError
-from xsdmesh.parser.xml_parser import ParseResult, SAXParser, parse_schema
+from xsdmesh.constants import XSD_NAMESPACE
+from xsdmesh.exceptions import CacheError, ParseError
+from xsdmesh.parser.xml_parser import ParseResult, SAXParser, _nsmap_diff, parse_schema
+from xsdmesh.types.qname import QName
+from xsdmesh.utils.cache import SchemaCache
 
 # Simple XSD schema for testing
 SIMPLE_SCHEMA = b"""<?xml version="1.0" encoding="UTF-8"?>
@@ -69,15 +73,9 @@ class TestSAXParserInit:
     def test_default_initialization(self) -> None:
         """Test SAXParser default initialization."""
         parser = SAXParser()
-        assert parser._memory_threshold == 1000
         assert parser._strict is False
         assert len(parser._handlers) == 0
 
-    def test_initialization_with_custom_threshold(self) -> None:
-        """Test SAXParser with custom memory threshold."""
-        parser = SAXParser(memory_threshold=5000)
-        assert parser._memory_threshold == 5000
-
     def test_initialization_strict_mode(self) -> None:
         """Test SAXParser in strict mode."""
         parser = SAXParser(strict=True)
@@ -89,7 +87,7 @@ class TestSAXParserInit:
         repr_str = repr(parser)
         assert "SAXParser" in repr_str
         assert "handlers=0" in repr_str
-        assert "threshold=1000" in repr_str
+        assert "strict=False" in repr_str
 
 
 class TestSAXParserParsing:
@@ -126,6 +124,38 @@ class TestSAXParserParsing:
         assert result.elements_processed > 0
         assert len(result.errors) == 0
 
+    def test_parse_file_in_small_chunks(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a file fed in many chunks parses like a single read."""
+        from xsdmesh.parser import xml_parser
+
+        schema_file = tmp_path / "nested.xsd"
+        schema_file.write_bytes(NESTED_SCHEMA)
+        monkeypatch.setattr(xml_parser, "_FEED_CHUNK_SIZE", 7)
+
+        chunked = SAXParser().parse(schema_file)
+        monkeypatch.undo()
+        whole = SAXParser().parse(BytesIO(NESTED_SCHEMA))
+
+        assert chunked.elements_processed == whole.elements_processed == 6
+        assert len(chunked.errors) == 0
+
+    def test_parse_skips_foreign_elements(self) -> None:
+        """Test only XSD-namespace elements are processed."""
+        parser = SAXParser()
+        xml = (
+            b'<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" xmlns:h="urn:html">'
+            b"<!-- comment --><xs:annotation><xs:documentation>"
+            b"<h:p>Some <h:b>rich</h:b> text</h:p>"
+            b"</xs:documentation></xs:annotation></xs:schema>"
+        )
+
+        result = parser.parse(BytesIO(xml))
+
+        assert result.elements_processed == 3
+        assert len(result.errors) == 0
+
     def test_parse_reads_target_namespace_from_schema(self) -> None:
         """Test parsing reads targetNamespace from schema element."""
         parser = SAXParser()
@@ -207,9 +237,17 @@ class TestSAXParserHandlers:
         handler = MockHandler()
 
         parser.register_handler("simpleType", handler)
+        parser.register_handler(f"{{{XSD_NAMESPACE}}}element", handler)
 
-        assert "simpleType" in parser._handlers
-        assert parser._handlers["simpleType"] == handler
+        # Local names default to the XSD namespace; keys are Clark tags
+        assert parser._handlers[f"{{{XSD_NAMESPACE}}}simpleType"] == handler
+        assert parser._handlers[f"{{{XSD_NAMESPACE}}}element"] == handler
+        assert "simpleType" not in parser._handlers
+
+        # Foreign elements are filtered out before dispatch
+        with pytest.raises(ValueError, match="XSD namespace"):
+            parser.register_handler("{urn:other}simpleType", handler)
+        assert "{urn:other}simpleType" not in parser._handlers
 
     def test_handler_called_during_parse(self) -> None:
         """Test handler is actually called during parsing."""
@@ -272,49 +310,198 @@ class TestParseSchemaFunction:
 
         assert isinstance(result, ParseResult)
 
+    def test_parse_schema_with_cache(self, tmp_path: Path) -> None:
+        """Test parse_schema stores and reuses cached results."""
+        schema_file = tmp_path / "schema.xsd"
+        schema_file.write_bytes(SIMPLE_SCHEMA)
+        cache: SchemaCache[ParseResult] = SchemaCache(tmp_path / "cache")
+
+        first = parse_schema(schema_file, cache=cache)
+        second = parse_schema(schema_file, cache=cache)
+
+        assert cache.misses == 1
+        assert cache.hits == 1
+        assert second.elements_processed == first.elements_processed
+        assert second.context.schema_location == str(schema_file)
+
+    def test_parse_schema_cache_invalidated_on_change(self, tmp_path: Path) -> None:
+        """Test changed schema content misses the cache."""
+        cache: SchemaCache[ParseResult] = SchemaCache(tmp_path / "cache")
+
+        parse_schema(BytesIO(SIMPLE_SCHEMA), cache=cache)
+        result = parse_schema(BytesIO(MULTI_ELEMENT_SCHEMA), cache=cache)
+
+        assert cache.misses == 2
+        assert result.elements_processed == 4
+
+    def test_parse_schema_reparses_corrupt_cache_entry(self, tmp_path: Path) -> None:
+        """Test an unreadable cache entry is a miss, not an error."""
+        cache: SchemaCache[ParseResult] = SchemaCache(tmp_path / "cache")
+        parse_schema(BytesIO(SIMPLE_SCHEMA), cache=cache)
+        (entry,) = (tmp_path / "cache").glob("*.pickle")
+
+        # Truncated entry: fails the checksum before it is unpickled
+        entry.write_bytes(b"\x80\x09")
+        with pytest.raises(CacheError, match="Failed to load"):
+            cache.load(entry.stem)
+
+        result = parse_schema(BytesIO(SIMPLE_SCHEMA), cache=cache)
+
+        assert result.elements_processed > 0
+        assert cache.misses == 3
+        assert cache.load(entry.stem) is not None
+
 
 class TestMemoryManagement:
     """Test memory management features."""
 
-    def test_elements_since_clear_increments(self) -> None:
-        """Test elements_since_clear counter increments."""
+    def test_finished_siblings_are_freed(self) -> None:
+        """Test completed previous siblings are removed from the tree."""
+        from lxml import etree
+
+        from xsdmesh.parser.context import ParseContext
+        from xsdmesh.parser.events import EventBuffer
+
+        child_counts: list[int] = []
+
+        class SchemaHandler:
+            def start_element(
+                self,
+                elem: etree._Element,
+                context: ParseContext,
+                buffer: EventBuffer,
+            ) -> None:
+                pass
+
+            def end_element(
+                self,
+                elem: etree._Element,
+                context: ParseContext,
+                buffer: EventBuffer,
+            ) -> None:
+                child_counts.append(len(elem))
+
         parser = SAXParser()
-        source = BytesIO(SIMPLE_SCHEMA)
+        parser.register_handler("schema", SchemaHandler())
 
-        # Parse should increment counter
-        parser.parse(source)
+        result = parser.parse(BytesIO(MULTI_ELEMENT_SCHEMA))
 
-        # After parse, counter should have been used
-        assert parser._elements_since_clear >= 0
+        # Only the last <xs:element> is still attached when <xs:schema> ends
+        assert result.elements_processed == 4
+        assert child_counts == [1]
 
-    def test_memory_threshold_triggers_cleanup(self) -> None:
-        """Test memory threshold triggers cleanup."""
-        # Use small threshold
-        parser = SAXParser(memory_threshold=1)
-        source = BytesIO(MULTI_ELEMENT_SCHEMA)
 
-        result = parser.parse(source)
+class TestLeafElements:
+    """Test fused dispatch of leaf elements."""
+
+    def test_leaf_and_parent_dispatch_order(self) -> None:
+        """Test leaves and elements with children see the same path and order."""
+        from lxml import etree
+
+        from xsdmesh.parser.context import ParseContext
+        from xsdmesh.parser.events import EventBuffer
+
+        calls: list[tuple[str, str, int]] = []
+
+        class TraceHandler:
+            def start_element(
+                self,
+                elem: etree._Element,
+                context: ParseContext,
+                buffer: EventBuffer,
+            ) -> None:
+                calls.append(("start", elem.get("value", "restriction"), context.depth))
 
-        # Counter should have been reset at least once
-        assert result.elements_processed > parser._memory_threshold
-        # Counter should be less than total (meaning it was reset)
-        assert parser._elements_since_clear < result.elements_processed
+            def end_element(
+                self,
+                elem: etree._Element,
+                context: ParseContext,
+                buffer: EventBuffer,
+            ) -> None:
+                calls.append(("end", elem.get("value", "restriction"), context.depth))
+
+        schema = b"""<?xml version="1.0"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+    <xs:simpleType name="Color">
+        <xs:restriction base="xs:string">
+            <xs:enumeration value="red"/>
+            <xs:enumeration value="green">
+                <xs:annotation><xs:documentation>Go</xs:documentation></xs:annotation>
+            </xs:enumeration>
+        </xs:restriction>
+    </xs:simpleType>
+</xs:schema>"""
+
+        parser = SAXParser()
+        tracer = TraceHandler()
+        parser.register_handler("restriction", tracer)
+        parser.register_handler("enumeration", tracer)
+
+        result = parser.parse(BytesIO(schema))
+
+        assert calls == [
+            ("start", "restriction", 3),
+            ("start", "red", 4),
+            ("end", "red", 4),
+            ("start", "green", 4),
+            ("end", "green", 4),
+            ("end", "restriction", 3),
+        ]
+        assert result.elements_processed == 7
+        assert result.context.depth == 0
+
+
+class TestNamespaceScopes:
+    """Test namespace scope bookkeeping during parsing."""
+
+    def test_scope_pushed_only_for_declaring_elements(self) -> None:
+        """Test elements without xmlns declarations reuse the parent scope."""
+        from lxml import etree
+
+        from xsdmesh.parser.context import ParseContext
+        from xsdmesh.parser.events import EventBuffer
+
+        scope_depths: list[int] = []
+
+        class ScopeHandler:
+            def start_element(
+                self,
+                elem: etree._Element,
+                context: ParseContext,
+                buffer: EventBuffer,
+            ) -> None:
+                scope_depths.append(len(context.namespace_stack))
+
+            def end_element(
+                self,
+                elem: etree._Element,
+                context: ParseContext,
+                buffer: EventBuffer,
+            ) -> None:
+                pass
+
+        parser = SAXParser()
+        parser.register_handler("element", ScopeHandler())
+
+        result = parser.parse(BytesIO(NESTED_SCHEMA))
+
+        # Builtin scope + <xs:schema> declarations, for every nested element
+        assert scope_depths == [2, 2, 2]
+        assert len(result.context.namespace_stack) == 1
 
 
 class TestNamespaceExtraction:
     """Test namespace extraction."""
 
     def test_extract_namespaces(self) -> None:
-        """Test _extract_namespaces method."""
+        """Test _nsmap_diff reports root declarations."""
         from lxml import etree
 
-        parser = SAXParser()
-
         # Create element with namespaces
         xml = b'<root xmlns:xs="http://www.w3.org/2001/XMLSchema" xmlns:tns="http://example.com"/>'
         elem = etree.fromstring(xml)
 
-        namespaces = parser._extract_namespaces(elem)
+        namespaces = _nsmap_diff(elem.nsmap, {})
 
         assert "xs" in namespaces
         assert namespaces["xs"] == "http://www.w3.org/2001/XMLSchema"
@@ -325,17 +512,28 @@ class TestNamespaceExtraction:
         """Test extracting default namespace."""
         from lxml import etree
 
-        parser = SAXParser()
-
         xml = b'<root xmlns="http://example.com"/>'
         elem = etree.fromstring(xml)
 
-        namespaces = parser._extract_namespaces(elem)
+        namespaces = _nsmap_diff(elem.nsmap, {})
 
         # Default namespace has empty string as key
         assert "" in namespaces
         assert namespaces[""] == "http://example.com"
 
+    def test_extract_namespaces_only_own_declarations(self) -> None:
+        """Test inherited bindings are not reported for child elements."""
+        from lxml import etree
+
+        xml = (
+            b'<root xmlns:a="http://a.com" xmlns:b="http://b.com">'
+            b'<plain/><redeclare xmlns:a="http://other.com"/></root>'
+        )
+        root = etree.fromstring(xml)
+
+        assert _nsmap_diff(root[0].nsmap, root.nsmap) == {}
+        assert _nsmap_diff(root[1].nsmap, root.nsmap) == {"a": "http://other.com"}
+
 
 class TestQNameExtraction:
     """Test QName extraction."""
@@ -367,3 +565,30 @@ class TestQNameExtraction:
 
         assert qname.namespace == ""
         assert qname.local_name == "root"
+
+    def test_get_qname_xsd_tag_precomputed(self) -> None:
+        """Test XSD tags resolve to shared precomputed QNames."""
+        from lxml import etree
+
+        parser = SAXParser()
+
+        xml = b'<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"><xs:element/></xs:schema>'
+        root = etree.fromstring(xml)
+
+        first = parser._get_qname(root[0])
+        second = parser._get_qname(etree.fromstring(xml)[0])
+
+        assert first == QName("http://www.w3.org/2001/XMLSchema", "element")
+        assert first is second
+
+    def test_get_qname_memoizes_foreign_tags(self) -> None:
+        """Test non-XSD tags are parsed once per parser."""
+        from lxml import etree
+
+        parser = SAXParser()
+
+        first = parser._get_qname(etree.fromstring(b'<a:x xmlns:a="urn:a"/>'))
+        second = parser._get_qname(etree.fromstring(b'<b:x xmlns:b="urn:a"/>'))
+
+        assert first == QName("urn:a", "x")
+        assert first is second
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import pickle
 from typing import Any
 
 import pytest
@@ -81,41 +82,23 @@ class TestComponentInit:
         assert comp.target_namespace is None
 
     def test_init_with_annotations(self) -> None:
-        """Test initialization with annotations stored as weak refs."""
-
-        # Use objects that support weakref (classes do, dicts don't)
-        class Annotation:
-            def __init__(self, doc: str) -> None:
-                self.doc = doc
-
-        ann1 = Annotation("First annotation")
-        ann2 = Annotation("Second annotation")
+        """Test initialization with annotations."""
+        ann1 = {"doc": "First annotation"}
+        ann2 = {"doc": "Second annotation"}
         comp = ConcreteComponent(annotations=[ann1, ann2])
 
-        # Annotations accessible while objects exist
-        assert len(comp.annotations) == 2
+        assert comp.annotations == (ann1, ann2)
         assert comp.annotations[0] is ann1
         assert comp.annotations[1] is ann2
 
-    def test_annotations_weak_reference(self) -> None:
-        """Test that annotations are stored as weak references."""
-        import weakref
-
-        class Annotation:
-            def __init__(self, doc: str) -> None:
-                self.doc = doc
-
-        comp = ConcreteComponent()
+    def test_annotations_owned_by_component(self) -> None:
+        """Test annotations stay alive with the component and are a snapshot."""
+        source = [{"doc": "test"}]
+        comp = ConcreteComponent(annotations=source)
 
-        # Create annotation and manually add weak ref
-        ann = Annotation("test")
-        comp._annotation_refs.append(weakref.ref(ann))
-        assert len(comp.annotations) == 1
-
-        # Delete strong reference - weak ref should become dead
-        del ann
-        # Annotations list filters out dead refs
-        assert len(comp.annotations) == 0
+        source.clear()
+        assert comp.annotations == ({"doc": "test"},)
+        assert ConcreteComponent().annotations == ()
 
 
 class TestComponentQName:
@@ -175,6 +158,27 @@ class TestComponentFreeze:
 
         assert "frozen" in str(exc_info.value).lower()
 
+    def test_freeze_keeps_class_identity(self) -> None:
+        """Test frozen component keeps its class name and isinstance checks."""
+        comp = ConcreteComponent(name="test")
+        comp.freeze()
+
+        assert isinstance(comp, ConcreteComponent)
+        assert type(comp).__name__ == "ConcreteComponent"
+        assert type(comp) is ConcreteComponent._frozen_class()
+
+    def test_frozen_component_pickle_roundtrip(self) -> None:
+        """Test frozen component unpickles frozen with its fields."""
+        comp = ConcreteComponent(name="test", target_namespace="http://example.com")
+        comp.freeze()
+
+        restored = pickle.loads(pickle.dumps(comp))
+
+        assert restored.is_frozen
+        assert restored.qname == comp.qname
+        with pytest.raises(FrozenError):
+            restored.name = "other"
+
     def test_unfrozen_component_allows_modification(self) -> None:
         """Test that unfrozen component allows modification."""
         comp = ConcreteComponent(name="test")
@@ -307,6 +311,21 @@ class TestTypeReference:
 
         assert "resolve" in str(exc_info.value).lower()
 
+    def test_resolve_from_mapping(self) -> None:
+        """Test resolution against a plain mapping, including errors."""
+        qname = QName("http://example.com", "Type")
+        target = ConcreteComponent(name="Type", target_namespace="http://example.com")
+        ref = TypeReference(qname)
+
+        assert ref.resolve_from({qname: target}) is target
+        assert ref.resolve_from({}) is target  # Cached
+        with pytest.raises(ResolutionError):
+            TypeReference(QName("", "Missing")).resolve_from({qname: target})
+
+    def test_type_reference_uses_slots(self) -> None:
+        """Test TypeReference has no instance __dict__."""
+        assert not hasattr(TypeReference(QName("", "Type")), "__dict__")
+
     def test_is_resolved_property(self) -> None:
         """Test is_resolved property tracks resolution state."""
         ref = TypeReference(QName("http://example.com", "Type"))
@@ -355,7 +374,7 @@ class TestValidationContext:
         assert ctx.id_map == {}
         assert ctx.path == []
         assert ctx.strict is True
-        assert ctx.errors == []
+        assert ctx.errors == ()
 
     def test_init_with_registry(self) -> None:
         """Test initialization with registry."""
@@ -383,6 +402,46 @@ class TestValidationContext:
 
         assert ctx.errors[0].context == "root/child"
 
+    def test_errors_materialized_lazily(self) -> None:
+        """Test errors are built on access and keep their identity."""
+        ctx = ValidationContext()
+        ctx.push_path("root")
+        ctx.add_error("First", code="E001")
+        assert ctx.error_count == 1
+
+        first = ctx.errors[0]
+        ctx.pop_path()
+        ctx.add_error("Second", severity="info")
+
+        assert ctx.errors[0] is first
+        assert first.context == "root"
+        assert ctx.errors[1].context is None
+        assert ctx.errors[1].severity == "info"
+
+    def test_errors_read_only_view(self) -> None:
+        """Test errors is one immutable tuple per state of the context."""
+        ctx = ValidationContext()
+        ctx.add_error("a")
+        errors = ctx.errors
+
+        assert ctx.errors is errors
+        with pytest.raises(AttributeError):
+            errors.append(errors[0])  # type: ignore[attr-defined]
+
+        ctx.add_error("b")
+        assert [e.message for e in ctx.errors] == ["a", "b"]
+        assert ctx.errors[0] is errors[0]
+
+    def test_path_edited_directly_is_reported(self) -> None:
+        """Test errors use the current path even when it is edited directly."""
+        ctx = ValidationContext()
+        ctx.push_path("x")
+        ctx.add_error("first")
+        ctx.path.append("y")
+        ctx.add_error("second")
+
+        assert [e.context for e in ctx.errors] == ["x", "x/y"]
+
     def test_push_pop_path(self) -> None:
         """Test push_path() and pop_path()."""
         ctx = ValidationContext()
@@ -403,7 +462,7 @@ class TestValidationContext:
         assert ctx.pop_path() is None
 
     def test_clone(self) -> None:
-        """Test clone() creates independent copy."""
+        """Test clone() copies path and errors and keeps writes local."""
         registry = MockRegistry()
         ctx = ValidationContext(
             registry=registry,
@@ -430,6 +489,33 @@ class TestValidationContext:
         assert len(ctx.errors) == 1
         assert len(cloned.errors) == 2
 
+    def test_clone_layers_mappings(self) -> None:
+        """Test nested clones read through to parents and write locally."""
+        ctx = ValidationContext(namespaces={"xs": "http://www.w3.org/2001/XMLSchema"})
+        child = ctx.clone()
+        child.id_map["id1"] = "elem"
+        grandchild = child.clone()
+        grandchild.namespaces["xs"] = "urn:shadow"
+
+        assert grandchild.id_map["id1"] == "elem"
+        assert child.namespaces["xs"] == "http://www.w3.org/2001/XMLSchema"
+        assert grandchild.namespaces["xs"] == "urn:shadow"
+        assert "id1" not in ctx.id_map
+
+    def test_clone_sees_later_parent_writes(self) -> None:
+        """Test clone mappings are live views of the parent, not copies."""
+        ctx = ValidationContext(namespaces={"a": "urn:a"})
+        cloned = ctx.clone()
+        ctx.namespaces["b"] = "urn:b"
+        ctx.id_map["id1"] = "elem"
+
+        assert cloned.namespaces["b"] == "urn:b"
+        assert cloned.id_map["id1"] == "elem"
+
+        with pytest.raises(KeyError):
+            del cloned.namespaces["a"]
+        assert ctx.namespaces["a"] == "urn:a"
+
     def test_repr(self) -> None:
         """Test __repr__() output."""
         ctx = ValidationContext()
@@ -9,13 +9,17 @@ Tests cover:
 
 from __future__ import annotations
 
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
+from typing import Any
 
 import pytest
 
+import xsdmesh.types.facets as facets_module
 from xsdmesh.types.facets import (
+    CompiledLexicalFacets,
     DigitsFacet,
     EnumerationFacet,
+    EnumerationSet,
     FacetResult,
     FacetValidator,
     LengthFacet,
@@ -24,6 +28,8 @@ from xsdmesh.types.facets import (
     RangeFacet,
     ValueFacets,
     WhitespaceFacet,
+    _bundle_for,
+    _compile_patterns,
 )
 
 # =============================================================================
@@ -54,6 +60,10 @@ class TestFacetResult:
         assert result.error is not None
         assert result.error.code == "cvc-test"
 
+    def test_ok_is_shared(self) -> None:
+        """Test successful results reuse a single instance."""
+        assert FacetResult.ok() is FacetResult.ok()
+
     def test_frozen(self) -> None:
         """Test FacetResult is immutable."""
         result = FacetResult.ok()
@@ -105,6 +115,11 @@ class TestWhitespaceFacet:
         result = WhitespaceFacet.normalize(value, "collapse")
         assert result == "hello world test"
 
+    def test_collapse_long_whitespace_run(self) -> None:
+        """Test collapse reduces a long mixed run to a single space."""
+        value = "a" + " \t\r\n" * 1000 + "b"
+        assert WhitespaceFacet.normalize(value, "collapse") == "a b"
+
     def test_unknown_mode_preserves(self) -> None:
         """Test unknown mode defaults to preserve."""
         value = "hello\tworld"
@@ -183,15 +198,75 @@ class TestPatternFacet:
         """Test pattern compilation is cached."""
         PatternFacet.clear_cache()
         PatternFacet.validate(r"\d+", "123")
-        PatternFacet.validate(r"\d+", "456")
-        # Same pattern should be in cache
-        assert r"\d+" in PatternFacet._cache
+        PatternFacet.validate([r"\d+"], "456")
+        # Single pattern and one-element list share one compiled alternation
+        info = _compile_patterns.cache_info()
+        assert info.misses == 1
+        assert info.currsize == 1
 
     def test_clear_cache(self) -> None:
         """Test cache clearing."""
         PatternFacet.validate(r"\d+", "123")
         PatternFacet.clear_cache()
-        assert len(PatternFacet._cache) == 0
+        assert _compile_patterns.cache_info().currsize == 0
+
+    def test_match_memo(self) -> None:
+        """Test repeated (patterns, value) pairs are matched once."""
+        PatternFacet.set_memo_size(16)
+        try:
+            assert PatternFacet.matches(("a+",), "aaa") is True
+            assert PatternFacet.validate("a+", "aaa").valid is True
+            info = facets_module._match_memo.cache_info()
+            assert (info.hits, info.misses) == (1, 1)
+
+            # Long values bypass the memo
+            assert PatternFacet.matches(("a+",), "a" * 5000) is True
+            assert facets_module._match_memo.cache_info().currsize == 1
+        finally:
+            PatternFacet.set_memo_size(8192)
+
+    def test_set_engine(self) -> None:
+        """Test a custom regex engine compiles pattern facets."""
+        import re
+
+        compiled: list[str] = []
+
+        def engine(pattern: str) -> re.Pattern[str]:
+            compiled.append(pattern)
+            return re.compile(pattern)
+
+        PatternFacet.set_engine(engine)
+        try:
+            assert PatternFacet.validate([r"\d+", "[a-z]+"], "abc").valid is True
+            assert LexicalFacets.check_all({"pattern": "x"}, "y") != []
+        finally:
+            PatternFacet.set_engine()
+
+        assert compiled == [r"(?:\d+)|(?:[a-z]+)", "(?:x)"]
+        assert PatternFacet.engine is re.compile
+        assert _compile_patterns.cache_info().currsize == 0
+
+    def test_use_pcre2(self) -> None:
+        """Test PCRE2 is used when installed and re is kept otherwise."""
+        import re
+
+        try:
+            switched = PatternFacet.use_pcre2()
+            assert (PatternFacet.engine is not re.compile) is switched
+            assert PatternFacet.validate([r"\d+", "[a-z]+"], "abc").valid is True
+            assert PatternFacet.validate(r"\d+", "abc").valid is False
+            result = PatternFacet.validate("[bad", "x")
+            assert result.error is not None
+            assert result.error.code == "pattern-invalid"
+        finally:
+            PatternFacet.set_engine()
+
+    def test_invalid_pattern_in_list_reported(self) -> None:
+        """Test the offending pattern is named when one of several is invalid."""
+        result = PatternFacet.validate([r"\d+", r"[bad"], "1")
+        assert result.error is not None
+        assert result.error.code == "pattern-invalid"
+        assert "[bad" in str(result.error)
 
 
 # =============================================================================
@@ -237,6 +312,41 @@ class TestEnumerationFacet:
         assert result.error is not None
         assert "6 values" in str(result.error)
 
+    def test_frozenset_values(self) -> None:
+        """Test frozenset enumeration, listed sorted in the error message."""
+        allowed = frozenset({"green", "blue", "red"})
+        assert EnumerationFacet.validate(allowed, "red").valid is True
+        result = EnumerationFacet.validate(allowed, "pink")
+        assert result.error is not None
+        assert "['blue', 'green', 'red']" in str(result.error)
+
+    def test_large_list_sees_appends(self) -> None:
+        """Test a large enumeration list is checked as it is now, not as first seen."""
+        codes = [f"C{i:03d}" for i in range(100)]
+        assert EnumerationFacet.validate(codes, "C042").valid is True
+        assert EnumerationFacet.validate(codes, "NEW").valid is False
+
+        codes.append("NEW")
+        assert EnumerationFacet.validate(codes, "NEW").valid is True
+
+    def test_enumeration_set(self) -> None:
+        """Test a frozen enumeration checks by hash and keeps list order in messages."""
+        codes = [f"C{i:03d}" for i in range(100)]
+        frozen = EnumerationSet(codes)
+        codes.append("NEW")
+
+        assert EnumerationFacet.validate(frozen, "C042").valid is True
+        assert EnumerationFacet.validate(frozen, "NEW").valid is False
+        assert EnumerationFacet.validate(frozen, "C04").valid is False
+        result = EnumerationFacet.validate(frozen, "x")
+        assert result.error is not None
+        assert "100 values" in str(result.error)
+
+        small = EnumerationFacet.validate(EnumerationSet(["b", "a"]), "x")
+        assert small.error is not None
+        assert str(small.error).endswith("Value 'x' not in enumeration: ['b', 'a']")
+        assert EnumerationFacet.validate(EnumerationSet([]), "x").valid is True
+
     def test_whitespace_values(self) -> None:
         """Test enumeration with whitespace values."""
         result = EnumerationFacet.validate(["hello world", "foo bar"], "hello world")
@@ -315,6 +425,121 @@ class TestLengthFacet:
 class TestLexicalFacets:
     """Tests for LexicalFacets orchestrator."""
 
+    def test_compile_matches_check_all(self) -> None:
+        """Test compiled checker reports the same errors as check_all."""
+        facets: dict[str, str | list[str] | int] = {
+            "pattern": "[a-z]+",
+            "enumeration": ["abc", "toolong"],
+            "minLength": "2",
+            "maxLength": 5,
+        }
+        check = LexicalFacets.compile(facets).check
+
+        for value in ["abc", "toolong", "x", "ABC", ""]:
+            expected = [e.code for e in LexicalFacets.check_all(facets, value)]
+            assert [e.code for e in check(value)] == expected
+
+    def test_bundle_reused_per_facets_dict(self) -> None:
+        """Test check_all compiles equal facets once and reuses the bundle."""
+        facets: dict[str, str | list[str] | int] = {"pattern": ["a+", "b+"], "length": "3"}
+        bundle = _bundle_for(facets)
+
+        assert isinstance(bundle, CompiledLexicalFacets)
+        assert _bundle_for(facets) is bundle
+        assert bundle.patterns == ("a+", "b+")
+        assert bundle.exact_len == 3
+
+        LexicalFacets.clear_cache()
+        assert _bundle_for(facets) is not bundle
+
+    def test_facets_changed_in_place_are_recompiled(self) -> None:
+        """Test editing a facets dict after first use is seen by check_all."""
+        facets: dict[str, str | list[str] | int] = {"maxLength": 5}
+        assert LexicalFacets.check_all(facets, "abcd") == []
+
+        facets["maxLength"] = 2
+        facets["pattern"] = "x+"
+        codes = {e.code for e in LexicalFacets.check_all(facets, "abcd")}
+        assert codes == {"cvc-maxLength-valid", "cvc-pattern-valid"}
+
+        enum: dict[str, str | list[str] | int] = {"enumeration": ["a", "b"]}
+        assert LexicalFacets.check_all(enum, "c") != []
+        values = enum["enumeration"]
+        assert isinstance(values, list)
+        values.append("c")
+        assert LexicalFacets.check_all(enum, "c") == []
+
+        # Same-length item assignment needs an explicit invalidation
+        values[0] = "z"
+        LexicalFacets.clear_cache()
+        assert LexicalFacets.check_all(enum, "z") == []
+        assert LexicalFacets.check_all(enum, "a") != []
+
+    def test_bundle_enum_length_window(self) -> None:
+        """Test values outside the enumeration length window are rejected."""
+        bundle = CompiledLexicalFacets({"enumeration": ["ab", "abcd"]})
+        assert bundle.enum is not None
+        assert (bundle.enum.min_len, bundle.enum.max_len) == (2, 4)
+        assert bundle.check("abcd") == []
+        assert [e.code for e in bundle.check("abc")] == ["cvc-enumeration-valid"]
+        assert [e.code for e in bundle.check("abcdefgh")] == ["cvc-enumeration-valid"]
+
+    def test_bundle_length_window(self) -> None:
+        """Test length facets merge into one window, including conflicting bounds."""
+        bundle = CompiledLexicalFacets({"minLength": 2, "maxLength": "4"})
+        assert (bundle.len_lo, bundle.len_hi) == (2, 4)
+        assert bundle.check("abc") == []
+        assert [e.code for e in bundle.check("abcde")] == ["cvc-maxLength-valid"]
+
+        conflicting = CompiledLexicalFacets({"length": 3, "maxLength": 2})
+        assert [e.code for e in conflicting.check("abc")] == ["cvc-maxLength-valid"]
+        assert [e.code for e in conflicting.check("ab")] == ["cvc-length-valid"]
+
+    def test_bundle_invalid_pattern(self) -> None:
+        """Test an invalid pattern is reported on every check."""
+        check = LexicalFacets.compile({"pattern": "[bad"}).check
+        assert [e.code for e in check("x")] == ["pattern-invalid"]
+        assert [e.code for e in check("y")] == ["pattern-invalid"]
+
+    def test_check_all_batch_matches_check_all(self) -> None:
+        """Test batch results equal per-value check_all, in order."""
+        facets: dict[str, str | list[str] | int] = {
+            "pattern": "[a-z]+",
+            "enumeration": ["abc", "toolong"],
+            "length": 3,
+            "maxLength": "5",
+        }
+        values = ["abc", "toolong", "x", "ABC", "", "abd"]
+
+        batch = LexicalFacets.check_all_batch(facets, values)
+
+        assert len(batch) == len(values)
+        for value, errors in zip(values, batch, strict=True):
+            expected = [e.code for e in LexicalFacets.check_all(facets, value)]
+            assert [e.code for e in errors] == expected
+
+    def test_fail_fast_reports_cheapest_failure(self) -> None:
+        """Test fail_fast stops at the first failure, length before pattern."""
+        facets: dict[str, str | list[str] | int] = {
+            "pattern": "[a-z]+",
+            "enumeration": ["abc", "toolong"],
+            "maxLength": 5,
+        }
+        assert LexicalFacets.check_all(facets, "abc", fail_fast=True) == []
+        full = [e.code for e in LexicalFacets.check_all(facets, "TOOLONG")]
+        assert full == ["cvc-pattern-valid", "cvc-enumeration-valid", "cvc-maxLength-valid"]
+
+        codes = [e.code for e in LexicalFacets.check_all(facets, "TOOLONG", fail_fast=True)]
+        assert codes == ["cvc-maxLength-valid"]
+        codes = [e.code for e in FacetValidator.check_lexical(facets, "ABC", fail_fast=True)]
+        assert codes == ["cvc-enumeration-valid"]
+        check = LexicalFacets.compile({"pattern": "[a-z]+"}).check_first
+        assert [e.code for e in check("ABC")] == ["cvc-pattern-valid"]
+
+    def test_compile_empty_facets(self) -> None:
+        """Test compiled checker for no facets accepts everything."""
+        assert LexicalFacets.compile({}).check("anything") == []
+
     def test_no_facets_valid(self) -> None:
         """Test empty facets always passes."""
         errors = LexicalFacets.check_all({}, "anything")
@@ -491,6 +716,14 @@ class TestDigitsFacet:
         result = DigitsFacet.validate_total_digits(5, Decimal("123.45"))
         assert result.valid is True
 
+    def test_digit_counts_match_as_tuple(self) -> None:
+        """Test digit counting agrees with Decimal.as_tuple() in all notations."""
+        for text in ["0", "-0.00", "0E-8", "1E+3", "1.20E+5", "0.000123", "-1.23E-7", "NaN"]:
+            value = Decimal(text)
+            _, digits, exp = value.as_tuple()
+            expected = (len(digits), -exp if isinstance(exp, int) and exp < 0 else 0)
+            assert facets_module._digit_counts(value) == expected, text
+
     def test_fraction_digits_valid(self) -> None:
         """Test fractionDigits satisfied."""
         result = DigitsFacet.validate_fraction_digits(2, Decimal("123.45"))
@@ -567,6 +800,54 @@ class TestValueFacets:
         assert ValueFacets.check_all(facets, Decimal("1.23")) == []
         assert len(ValueFacets.check_all(facets, Decimal("1.234"))) == 1
 
+    def test_bounds_parsed_once_per_facets_dict(self) -> None:
+        """Test bounds are parsed into a reused CompiledValueFacets."""
+        facets: dict[str, str | int] = {"minInclusive": "1.5", "fractionDigits": "1"}
+        bundle = facets_module._value_bundle_for(facets)
+
+        assert facets_module._value_bundle_for(facets) is bundle
+        assert bundle.min_inclusive == Decimal("1.5")
+        assert bundle.fraction_digits == 1
+        assert [e.code for e in ValueFacets.check_all(facets, Decimal("1.25"))] == [
+            "cvc-minInclusive-valid",
+            "cvc-fractionDigits-valid",
+        ]
+
+    def test_typed_bounds_skip_string_parsing(self) -> None:
+        """Test Decimal bounds pass through and int bounds convert exactly."""
+        bound = Decimal("2.50")
+        facets: dict[str, Any] = {"minInclusive": bound, "maxExclusive": 10**30}
+        bundle = facets_module._value_bundle_for(facets)
+
+        assert bundle.min_inclusive is bound
+        assert bundle.max_exclusive == Decimal(10**30)
+        assert ValueFacets.check_all(facets, Decimal("3")) == []
+        assert len(ValueFacets.check_all(facets, Decimal("2.4"))) == 1
+
+    def test_facets_changed_in_place_are_reparsed(self) -> None:
+        """Test a facets dict edited after first use is not served stale bounds."""
+        facets: dict[str, str | int] = {"maxInclusive": "10"}
+        assert ValueFacets.check_all(facets, Decimal(5)) == []
+
+        facets["maxInclusive"] = "3"
+        codes = [e.code for e in ValueFacets.check_all(facets, Decimal(5))]
+        assert codes == ["cvc-maxInclusive-valid"]
+        assert facets_module._value_bundle_for(dict(facets)) is (
+            facets_module._value_bundle_for(facets)
+        )
+
+    def test_invalid_bound_stops_later_facets(self) -> None:
+        """Test an unparsable bound reports after earlier facets only."""
+        facets: dict[str, str | int] = {
+            "minInclusive": "10",
+            "maxInclusive": "oops",
+            "totalDigits": 1,
+        }
+        codes = [e.code for e in ValueFacets.check_all(facets, Decimal("55"))]
+        assert codes == ["cvc-datatype-valid"]
+        codes = [e.code for e in ValueFacets.check_all(facets, Decimal("5"))]
+        assert codes == ["cvc-minInclusive-valid", "cvc-datatype-valid"]
+
     def test_multiple_facets(self) -> None:
         """Test multiple value facets combined."""
         facets: dict[str, str | int] = {
@@ -597,6 +878,31 @@ class TestValueFacets:
         assert ValueFacets.check_all(facets, Decimal("15")) == []
         assert len(ValueFacets.check_all(facets, Decimal("10"))) == 1
 
+    def test_int_values_match_decimal_values(self) -> None:
+        """Test the integer window agrees with Decimal comparisons."""
+        facets: dict[str, str | int] = {
+            "minExclusive": "-2.5",
+            "maxInclusive": "7.9",
+            "totalDigits": 1,
+        }
+        bundle = facets_module._value_bundle_for(facets)
+        assert (bundle.int_lo, bundle.int_hi) == (-2, 7)
+
+        for n in range(-5, 12):
+            int_codes = [e.code for e in ValueFacets.check_all(facets, n)]
+            decimal_codes = [e.code for e in ValueFacets.check_all(facets, Decimal(n))]
+            assert int_codes == decimal_codes
+        assert ValueFacets.check_all(facets, 7) == []
+        assert [e.message for e in ValueFacets.check_all(facets, 8)] == [
+            "Value 8 > maxInclusive 7.9"
+        ]
+
+    def test_int_values_with_infinite_bound(self) -> None:
+        """Test non-finite bounds fall back to Decimal comparisons."""
+        facets: dict[str, str | int] = {"maxInclusive": "Infinity"}
+        assert not facets_module._value_bundle_for(facets).int_window
+        assert ValueFacets.check_all(facets, 10**30) == []
+
 
 # =============================================================================
 # FacetValidator Unified Tests
@@ -606,12 +912,33 @@ class TestValueFacets:
 class TestFacetValidator:
     """Tests for FacetValidator unified interface."""
 
+    def test_parse_decimal_cached(self) -> None:
+        """Test decimal parsing returns the shared cached value."""
+        first = FacetValidator.parse_decimal("12.50")
+        assert first == Decimal("12.50")
+        assert FacetValidator.parse_decimal("12.50") is first
+
+    def test_parse_decimal_invalid(self) -> None:
+        """Test invalid lexical form raises InvalidOperation."""
+        with pytest.raises(InvalidOperation):
+            FacetValidator.parse_decimal("abc")
+
     def test_check_lexical(self) -> None:
         """Test check_lexical delegates correctly."""
         facets: dict[str, str | list[str] | int] = {"pattern": r"\d+"}
         assert FacetValidator.check_lexical(facets, "123") == []
         assert len(FacetValidator.check_lexical(facets, "abc")) == 1
 
+    def test_check_lexical_compiled(self) -> None:
+        """Test check_lexical accepts facets compiled once up front."""
+        facets: dict[str, str | list[str] | int] = {"pattern": r"\d+", "maxLength": "2"}
+        compiled = LexicalFacets.compile(facets)
+
+        assert FacetValidator.check_lexical(compiled, "12") == []
+        assert [e.code for e in FacetValidator.check_lexical(compiled, "123")] == [
+            "cvc-maxLength-valid"
+        ]
+
     def test_check_value(self) -> None:
         """Test check_value delegates correctly."""
         facets: dict[str, str | int] = {"minInclusive": "10"}
@@ -642,6 +969,11 @@ class TestFacetValidator:
         assert "pattern" in facets
         assert "minInclusive" in facets
         assert "totalDigits" in facets
+        assert facets == sorted(facets)
+
+        # Callers get their own list; the cached names stay intact
+        facets.clear()
+        assert len(FacetValidator.get_supported_facets()) == 12
 
     def test_is_lexical_facet(self) -> None:
         """Test is_lexical_facet classification."""
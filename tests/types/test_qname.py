@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import pickle
+import sys
+
 import pytest
 
+import xsdmesh.types.qname as qname_module
 from xsdmesh.exceptions import ParseError
-from xsdmesh.types.qname import QName, is_ncname, parse_qname, split_qname
+from xsdmesh.types.qname import QName, is_ncname, is_ncname_all, parse_qname, split_qname
 
 
 class TestQName:
-    """Test QName NamedTuple."""
+    """Test QName value type."""
 
     def test_qname_creation(self) -> None:
         """Test QName creation."""
@@ -27,6 +31,14 @@ class TestQName:
         qname = QName("", "localName")
         assert qname.expanded == "localName"
 
+    def test_qname_expanded_bytes_cached(self) -> None:
+        """Test expanded_bytes is the UTF-8 Clark form, encoded once."""
+        qname = QName("http://example.com/é", "foo")
+        data = qname.expanded_bytes
+        assert data == qname.expanded.encode("utf-8")
+        assert qname.expanded_bytes is data
+        assert qname == QName("http://example.com/é", "foo")
+
     def test_qname_str(self) -> None:
         """Test QName.__str__."""
         qname = QName("http://example.com", "foo")
@@ -42,6 +54,28 @@ class TestQName:
         qname = QName("", "foo")
         assert repr(qname) == "QName('foo')"
 
+    def test_qname_hash_and_equality(self) -> None:
+        """Test equal QNames hash alike and work as dict keys."""
+        first = QName("http://example.com", "foo")
+        second = QName("http://example.com", "foo")
+        assert first == second
+        assert hash(first) == hash(second)
+        assert {first: 1}[second] == 1
+        assert first != QName("http://example.com", "bar")
+
+    def test_qname_immutable(self) -> None:
+        """Test QName fields cannot be reassigned."""
+        qname = QName("", "foo")
+        with pytest.raises(AttributeError):
+            qname.local_name = "bar"  # type: ignore[misc]
+
+    def test_qname_pickle_roundtrip(self) -> None:
+        """Test pickled QName is equal and rehashed."""
+        qname = QName("http://example.com", "foo")
+        restored = pickle.loads(pickle.dumps(qname))
+        assert restored == qname
+        assert hash(restored) == hash(qname)
+
 
 class TestParseQName:
     """Test parse_qname function."""
@@ -65,6 +99,15 @@ class TestParseQName:
         assert qname.namespace == "http://www.w3.org/2001/XMLSchema"
         assert qname.local_name == "string"
 
+    def test_prefix_notation_with_callable_resolver(self) -> None:
+        """Test prefix notation with callable resolver."""
+        namespaces = {"xs": "http://www.w3.org/2001/XMLSchema"}
+        qname = parse_qname("xs:string", resolver=namespaces.get)
+        assert qname == QName("http://www.w3.org/2001/XMLSchema", "string")
+
+        with pytest.raises(ParseError, match="Undefined namespace prefix: 'foo'"):
+            parse_qname("foo:bar", resolver=namespaces.get)
+
     def test_prefix_notation_without_resolver(self) -> None:
         """Test prefix notation without resolver raises error."""
         with pytest.raises(ParseError, match="No namespace resolver provided"):
@@ -99,6 +142,36 @@ class TestParseQName:
         with pytest.raises(ParseError, match="Empty local name"):
             parse_qname("xs:", resolver=resolver)
 
+    def test_parse_qname_returns_pooled_instance(self) -> None:
+        """Test equal QNames from parse_qname share one instance."""
+        resolver = {"xs": "http://www.w3.org/2001/XMLSchema"}
+        first = parse_qname("xs:string", resolver=resolver)
+        second = parse_qname("{http://www.w3.org/2001/XMLSchema}string")
+        assert first is second
+
+    def test_builtin_qnames_survive_pool_eviction(self) -> None:
+        """Test filling the pool does not evict XSD built-in type QNames."""
+        builtin = parse_qname("{http://www.w3.org/2001/XMLSchema}string")
+        for i in range(qname_module._QNAME_POOL_SIZE + 1):
+            parse_qname(f"{{urn:eviction-test}}n{i}")
+
+        assert len(qname_module._QNAME_POOL) <= qname_module._QNAME_POOL_SIZE
+        assert parse_qname("{http://www.w3.org/2001/XMLSchema}string") is builtin
+
+    def test_parse_qname_interns_strings(self) -> None:
+        """Test namespace and local name of new QNames are interned."""
+        namespace = "".join(["urn:", "interned-", "test"])
+        qname = parse_qname("{" + namespace + "}Local")
+        assert qname.namespace is sys.intern("urn:interned-test")
+        assert qname.local_name is sys.intern("Local")
+
+    def test_invalid_clark_notation_error(self) -> None:
+        """Test unterminated or local-less Clark notation raises error."""
+        with pytest.raises(ParseError, match="Invalid Clark notation"):
+            parse_qname("{http://example.com")
+        with pytest.raises(ParseError, match="Invalid Clark notation"):
+            parse_qname("{http://example.com}")
+
     def test_empty_text_error(self) -> None:
         """Test empty text raises error."""
         with pytest.raises(ParseError, match="QName text cannot be empty"):
@@ -168,3 +241,10 @@ class TestIsNCName:
         assert not is_ncname("invalid@name")
         assert not is_ncname("invalid name")
         assert not is_ncname("invalid#name")
+
+    def test_is_ncname_all(self) -> None:
+        """Test batch NCName validation."""
+        assert is_ncname_all(["a", "_b", "c-d.e"])
+        assert is_ncname_all([])
+        assert not is_ncname_all(["a", "1b"])
+        assert not is_ncname_all(["a", ""])
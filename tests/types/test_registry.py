@@ -14,6 +14,7 @@ from xsdmesh.types import (
     ValidationResult,
 )
 from xsdmesh.types.qname import QName
+from xsdmesh.types.storage import DictStorage
 
 # =============================================================================
 # Test fixture: Concrete Component for testing
@@ -140,6 +141,18 @@ class TestRegistryLookup:
         with pytest.raises(KeyError):
             _ = registry[QName("http://x.com", "X")]
 
+    def test_read_methods_bound_to_storage(self) -> None:
+        """Test read methods dispatch straight to the storage backend."""
+        storage: DictStorage[MockComponent] = DictStorage()
+        registry: ComponentRegistry[MockComponent] = ComponentRegistry(storage=storage)
+        comp = make_component("MyType")
+        registry.register(comp)
+
+        assert registry.lookup.__self__ is storage  # type: ignore[attr-defined]
+        assert registry.lookup(comp.qname) is comp
+        assert registry.by_namespace("http://example.com") == [comp]
+        assert registry.all_components() == [comp]
+
 
 class TestRegistryBloomFilter:
     """Tests for Bloom filter negative lookup optimization."""
@@ -270,6 +283,18 @@ class TestRegistryDeferredResolution:
         assert resolved[0] is comp
         assert qname not in registry.pending_qnames()
 
+    def test_register_other_qname_keeps_pending(self) -> None:
+        """Test registering an unrelated component leaves callbacks pending."""
+        registry: ComponentRegistry[MockComponent] = ComponentRegistry()
+        qname = QName("http://example.com", "Later")
+        resolved: list[MockComponent] = []
+        registry.defer_resolution(qname, resolved.append)
+
+        registry.register(MockComponent(name="Other", target_namespace="http://example.com"))
+
+        assert resolved == []
+        assert registry.pending_qnames() == [qname]
+
     def test_defer_multiple_callbacks(self) -> None:
         """Test multiple callbacks for same QName."""
         registry: ComponentRegistry[MockComponent] = ComponentRegistry()
@@ -317,6 +342,18 @@ class TestRegistryIteration:
         for comp in comps:
             assert comp in all_comps
 
+    def test_iter_components(self) -> None:
+        """Test iter_components streams the same components."""
+        registry: ComponentRegistry[MockComponent] = ComponentRegistry()
+        for i in range(5):
+            registry.register(make_component(f"Type{i}"))
+
+        assert sum(1 for _ in registry.iter_components()) == 5
+        assert list(registry.iter_components()) == registry.all_components()
+        assert list(registry.iter_namespace("http://example.com")) == registry.by_namespace(
+            "http://example.com"
+        )
+
 
 class TestRegistryWithTypeReference:
     """Tests for registry integration with TypeReference."""
@@ -372,6 +409,34 @@ class TestRegistryStats:
         assert stats.namespaces == 5
         assert stats.pending_callbacks == 1
 
+    def test_stats_cached_until_mutation(self) -> None:
+        """Test stats snapshot is reused and refreshed after mutations."""
+        registry: ComponentRegistry[MockComponent] = ComponentRegistry()
+        registry.register(make_component("A"))
+
+        stats = registry.stats()
+        assert registry.stats() is stats
+
+        registry.defer_resolution(QName("http://x.com", "Future"), lambda x: None)
+        assert registry.stats().pending_callbacks == 1
+
+        registry.register(make_component("B"))
+        assert registry.stats().total_components == 2
+
+        registry.clear()
+        assert registry.stats().total_components == 0
+
+    def test_stats_sees_direct_storage_writes(self) -> None:
+        """Test writes through the storage property invalidate the snapshot."""
+        registry: ComponentRegistry[MockComponent] = ComponentRegistry(storage=DictStorage())
+        assert registry.stats().total_components == 0
+
+        component = make_component("A")
+        registry.storage.store(component.qname, component)
+        stats = registry.stats()
+        assert stats.total_components == 1
+        assert stats.bloom_size_bytes == 0
+
 
 class TestRegistryClear:
     """Tests for registry clear operation."""
@@ -114,6 +114,21 @@ class TestDictStorageBasic:
         assert len(storage) == 0
         assert comp.qname not in storage
 
+    def test_remove_updates_namespace_index(self) -> None:
+        """Test remove drops only that component and empty namespaces."""
+        storage = DictStorage[MockComponent]()
+        comp1 = make_component("Type1", "http://ns1.com")
+        comp2 = make_component("Type2", "http://ns1.com")
+        comp3 = make_component("Type3", "http://ns2.com")
+        for comp in (comp1, comp2, comp3):
+            storage.store(comp.qname, comp)
+
+        assert storage.remove(comp1.qname) is True
+        assert storage.by_namespace("http://ns1.com") == [comp2]
+        assert storage.remove(comp3.qname) is True
+        assert storage.namespaces() == ["http://ns1.com"]
+        assert storage.by_namespace("http://ns2.com") == []
+
     def test_remove_not_found(self) -> None:
         """Test remove returns False when not found."""
         storage = DictStorage[MockComponent]()
@@ -163,6 +178,26 @@ class TestDictStorageNamespace:
         assert comp1 in prefix_comps
         assert comp2 in prefix_comps
 
+    def test_by_namespace_prefix_cached_until_mutation(self) -> None:
+        """Test prefix results are memoized, copied and invalidated."""
+        storage = DictStorage[MockComponent]()
+        comp1 = make_component("Type1", "http://example.com/v1")
+        storage.store(comp1.qname, comp1)
+
+        first = storage.by_namespace_prefix("http://example.com/")
+        first.clear()
+        assert storage.by_namespace_prefix("http://example.com/") == [comp1]
+
+        comp2 = make_component("Type2", "http://example.com/v2")
+        storage.store(comp2.qname, comp2)
+        assert storage.by_namespace_prefix("http://example.com/") == [comp1, comp2]
+
+        storage.remove(comp1.qname)
+        assert storage.by_namespace_prefix("http://example.com/") == [comp2]
+
+        storage.clear()
+        assert storage.by_namespace_prefix("http://example.com/") == []
+
     def test_namespaces(self) -> None:
         """Test namespaces returns all unique namespaces."""
         storage = DictStorage[MockComponent]()
@@ -213,6 +248,21 @@ class TestDictStorageIteration:
         assert comp1 in items
         assert comp2 in items
 
+    def test_iter_items(self) -> None:
+        """Test iter_items yields components lazily, in all_items order."""
+        storage = DictStorage[MockComponent]()
+        for i in range(3):
+            comp = make_component(f"Type{i}", f"http://ns{i % 2}.com")
+            storage.store(comp.qname, comp)
+
+        items = storage.iter_items()
+        assert not isinstance(items, list)
+        assert list(items) == storage.all_items()
+        assert list(storage.iter_namespace("http://ns0.com")) == storage.by_namespace(
+            "http://ns0.com"
+        )
+        assert list(storage.iter_namespace("http://missing.com")) == []
+
 
 class TestDictStorageClear:
     """Tests for DictStorage clear operation."""
@@ -318,6 +368,24 @@ class TestTrieStorageBasic:
         assert len(storage) == 0
         # Note: Bloom filter may still return True (acceptable false positive)
 
+    def test_remove_last_in_namespace(self) -> None:
+        """Test an emptied namespace leaves scans and can be refilled."""
+        storage = TrieStorage[MockComponent]()
+        comp1 = make_component("Type1", "http://ns1.com")
+        comp2 = make_component("Type2", "http://ns2.com")
+        storage.store(comp1.qname, comp1)
+        storage.store(comp2.qname, comp2)
+
+        storage.remove(comp1.qname)
+        assert storage.namespaces() == ["http://ns2.com"]
+        assert storage.stats().namespaces == 1
+        assert list(storage) == [comp2.qname]
+
+        storage.store(comp1.qname, comp1)
+        assert storage.lookup(comp1.qname) is comp1
+        assert storage.by_namespace_prefix("http://ns1") == [comp1]
+        assert sorted(storage.namespaces()) == ["http://ns1.com", "http://ns2.com"]
+
     def test_remove_not_found(self) -> None:
         """Test remove returns False when not found."""
         storage = TrieStorage[MockComponent]()
@@ -481,6 +549,21 @@ class TestTrieStorageIteration:
         assert comp1 in items
         assert comp2 in items
 
+    def test_iter_items(self) -> None:
+        """Test iter_items yields components lazily, in all_items order."""
+        storage = TrieStorage[MockComponent]()
+        for i in range(3):
+            comp = make_component(f"Type{i}", f"http://ns{i % 2}.com")
+            storage.store(comp.qname, comp)
+
+        items = storage.iter_items()
+        assert not isinstance(items, list)
+        assert list(items) == storage.all_items()
+        assert list(storage.iter_namespace("http://ns0.com")) == storage.by_namespace(
+            "http://ns0.com"
+        )
+        assert list(storage.iter_namespace("http://missing.com")) == []
+
 
 class TestTrieStorageClear:
     """Tests for TrieStorage clear operation."""
@@ -0,0 +1,107 @@
+"""Tests for constants.py: built-in type tables."""
+
+from __future__ import annotations
+
+import pytest
+
+from xsdmesh.constants import (
+    ALL_BUILTIN_TYPES,
+    BUILTIN_TYPE_IDS,
+    DERIVED_TYPES,
+    DERIVED_TYPES_MASK,
+    LIST_TYPES,
+    LIST_TYPES_MASK,
+    PRIMITIVE_TYPES,
+    PRIMITIVE_TYPES_MASK,
+    SPECIAL_TYPES,
+    SPECIAL_TYPES_MASK,
+    TYPE_DEPTHS,
+    TYPE_DERIVATION,
+    BlockSet,
+    FinalSet,
+    is_derived_from,
+    parse_block_set,
+    parse_final_set,
+    type_in_mask,
+)
+
+
+class TestBuiltinTypeIds:
+    """Test built-in type IDs and category bitmasks."""
+
+    def test_ids_are_dense(self) -> None:
+        """Test every built-in type has a unique ID in range."""
+        assert set(BUILTIN_TYPE_IDS) == ALL_BUILTIN_TYPES
+        assert sorted(BUILTIN_TYPE_IDS.values()) == list(range(len(ALL_BUILTIN_TYPES)))
+
+    def test_masks_match_sets(self) -> None:
+        """Test mask membership agrees with frozenset membership."""
+        categories = [
+            (PRIMITIVE_TYPES, PRIMITIVE_TYPES_MASK),
+            (DERIVED_TYPES, DERIVED_TYPES_MASK),
+            (SPECIAL_TYPES, SPECIAL_TYPES_MASK),
+            (LIST_TYPES, LIST_TYPES_MASK),
+        ]
+        for name, type_id in BUILTIN_TYPE_IDS.items():
+            for names, mask in categories:
+                assert type_in_mask(type_id, mask) == (name in names)
+
+    def test_ancestor_masks_match_derivation(self) -> None:
+        """Test ancestor bitmasks agree with walking TYPE_DERIVATION."""
+        for name, type_id in BUILTIN_TYPE_IDS.items():
+            ancestors = set()
+            base = TYPE_DERIVATION[name]
+            while base is not None:
+                ancestors.add(base)
+                base = TYPE_DERIVATION[base]
+            assert TYPE_DEPTHS[type_id] == len(ancestors)
+            for other, other_id in BUILTIN_TYPE_IDS.items():
+                assert is_derived_from(type_id, other_id) == (other in ancestors)
+
+    def test_is_derived_from(self) -> None:
+        """Test derivation checks on known chains."""
+        ids = BUILTIN_TYPE_IDS
+        assert is_derived_from(ids["unsignedByte"], ids["decimal"])
+        assert is_derived_from(ids["ID"], ids["anyType"])
+        assert not is_derived_from(ids["string"], ids["token"])
+        assert not is_derived_from(ids["int"], ids["int"])
+        assert TYPE_DEPTHS[ids["anyType"]] == 0
+
+
+class TestBuiltinTypeSets:
+    """Test built-in type name sets."""
+
+    def test_all_builtin_types_is_union(self) -> None:
+        """Test the literal ALL_BUILTIN_TYPES matches its categories."""
+        assert ALL_BUILTIN_TYPES == PRIMITIVE_TYPES | DERIVED_TYPES | SPECIAL_TYPES
+
+    def test_type_derivation_covers_builtins(self) -> None:
+        """Test the TYPE_DERIVATION literal covers every built-in type."""
+        assert set(TYPE_DERIVATION) == ALL_BUILTIN_TYPES
+        for name in PRIMITIVE_TYPES:
+            assert TYPE_DERIVATION[name] == "anySimpleType"
+
+
+class TestDerivationSets:
+    """Test BlockSet/FinalSet flag parsing."""
+
+    def test_parse_block_set(self) -> None:
+        """Test space-separated block tokens combine into flags."""
+        flags = parse_block_set("extension  restriction")
+        assert flags & BlockSet.EXTENSION
+        assert flags & BlockSet.RESTRICTION
+        assert not flags & BlockSet.SUBSTITUTION
+        assert parse_block_set("#all") == BlockSet.ALL
+        assert parse_block_set("") == BlockSet(0)
+
+    def test_parse_final_set(self) -> None:
+        """Test final tokens combine into flags."""
+        assert parse_final_set("list union") == FinalSet.LIST | FinalSet.UNION
+        assert parse_final_set("#all") == FinalSet.ALL
+
+    def test_invalid_token_raises(self) -> None:
+        """Test unknown tokens are rejected."""
+        with pytest.raises(ValueError, match="Invalid block value: 'list'"):
+            parse_block_set("list")
+        with pytest.raises(ValueError, match="Invalid final value: 'substitution'"):
+            parse_final_set("substitution")
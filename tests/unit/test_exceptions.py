@@ -0,0 +1,124 @@
+"""Tests for exceptions.py: message formatting of the exception hierarchy."""
+
+from __future__ import annotations
+
+import pickle
+
+from xsdmesh.exceptions import (
+    CircularReferenceError,
+    ParseError,
+    ResolutionError,
+    SchemaImportError,
+    ValidationError,
+)
+
+
+class TestParseError:
+    """Test ParseError message formatting."""
+
+    def test_message_only(self) -> None:
+        """Test plain message without context."""
+        error = ParseError("Bad schema")
+        assert str(error) == "Bad schema"
+        assert error.args == ("Bad schema",)
+
+    def test_full_context(self) -> None:
+        """Test message with all location fields."""
+        error = ParseError(
+            "Bad schema",
+            file_path="a.xsd",
+            line=3,
+            column=7,
+            context="/schema/element",
+            element="element",
+        )
+        assert str(error) == (
+            "Bad schema in a.xsd at line 3, column 7 (context: /schema/element) (element: element)"
+        )
+        assert error.args == ("Bad schema",)
+        assert error.line == 3
+
+    def test_line_without_column(self) -> None:
+        """Test line is reported without column."""
+        assert str(ParseError("Oops", line=0)) == "Oops at line 0"
+
+
+class TestValidationError:
+    """Test ValidationError message formatting."""
+
+    def test_severity_and_code(self) -> None:
+        """Test severity prefix, code and context."""
+        error = ValidationError("Too long", code="cvc-maxLength", context="/a/b")
+        assert str(error) == "[ERROR] [cvc-maxLength] Too long (at /a/b)"
+
+    def test_warning_without_code(self) -> None:
+        """Test warning severity without code."""
+        assert str(ValidationError("Hmm", severity="warning")) == "[WARNING] Hmm"
+
+    def test_lazy_message(self) -> None:
+        """Test template message is formatted on first read and survives pickling."""
+        error = ValidationError("Length {} != {}", code="cvc-length-valid", message_args=(3, 5))
+        assert error._message_args == (3, 5)
+
+        restored = pickle.loads(pickle.dumps(error))
+        assert restored.message == "Length 3 != 5"
+
+        assert str(error) == "[ERROR] [cvc-length-valid] Length 3 != 5"
+        assert error._message_args == ()
+        assert error.message == "Length 3 != 5"
+
+
+class TestResolutionError:
+    """Test ResolutionError and CircularReferenceError formatting."""
+
+    def test_resolution_error(self) -> None:
+        """Test QName, reference type and location."""
+        error = ResolutionError(
+            "Cannot resolve", qname="tns:Foo", reference_type="type", location="/schema"
+        )
+        assert str(error) == "Cannot resolve 'tns:Foo' (type: type) at /schema"
+
+    def test_circular_reference_cycle(self) -> None:
+        """Test cycle is appended and closed."""
+        error = CircularReferenceError("Cycle", cycle=["A", "B"], qname="A")
+        assert str(error) == "Cycle 'A' (cycle: A -> B -> A)"
+        assert error.cycle == ["A", "B"]
+
+    def test_circular_reference_without_cycle(self) -> None:
+        """Test empty cycle leaves message unchanged."""
+        assert str(CircularReferenceError("Cycle")) == "Cycle"
+
+
+class TestSchemaImportError:
+    """Test SchemaImportError formatting."""
+
+    def test_full_context(self) -> None:
+        """Test namespace, location and cause."""
+        error = SchemaImportError(
+            "Import failed",
+            namespace="urn:x",
+            location="x.xsd",
+            cause=OSError("missing"),
+        )
+        assert str(error) == (
+            "Import failed (namespace: urn:x) (location: x.xsd) - caused by: missing"
+        )
+
+
+class TestSlots:
+    """Test slot-based storage and pickling of exceptions."""
+
+    def test_fields_stored_in_slots(self) -> None:
+        """Test context fields do not populate the instance __dict__."""
+        error = ParseError("Bad", line=1, element="element")
+        assert "line" in ParseError.__slots__
+        assert error.__dict__ == {}
+
+    def test_pickle_roundtrip(self) -> None:
+        """Test slot fields survive pickling."""
+        error = CircularReferenceError("Cycle", cycle=["A", "B"], qname="A")
+        restored = pickle.loads(pickle.dumps(error))
+        assert type(restored) is CircularReferenceError
+        assert restored.cycle == ["A", "B"]
+        assert restored.qname == "A"
+        assert str(restored) == str(error)